@@ -3,59 +3,112 @@ Flask web app for practicing multi-language assessment problems in the browser.
 Supports Python, JavaScript, Java, and C++.
 """
 
+import ast
+import atexit
+import base64
+import builtins
+import gc
+import hashlib
+import http.client
 import io
 import json
+import marshal
 import os
+import queue
 import re
 import shutil
+import signal
 import ssl
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 from urllib import request as urlrequest
 from urllib.error import HTTPError, URLError
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder is used instead
+    orjson = None
+
+
+class _JSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, also accepting the read-only mappings used for static data."""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
 
 app = Flask(__name__, static_folder='static', static_url_path='')
+app.json = _JSONProvider(app)
+
+def _json_response(obj) -> Response:
+    """jsonify(obj), encoded straight to bytes by orjson when it is installed.
+
+    Only for payloads built from str, int, bool, None, lists and str-keyed dicts
+    (no floats, whose formatting and NaN handling differ). For those the output
+    parses to the same value as jsonify's, keys sorted the same way; the one
+    difference is that non-ASCII text is sent as UTF-8 rather than \\u escapes.
+    Debug mode, and anything orjson rejects (ints beyond 64 bits), use jsonify.
+    """
+    if orjson is not None and not app.debug:
+        try:
+            body = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+        else:
+            return Response(body, mimetype='application/json')
+    return jsonify(obj)
 
 # Simple .env loader to avoid extra deps
-def _load_env_file(path: str = '.env'):
-    try:
-        with open(path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    k, v = line.split('=', 1)
-                    os.environ[k.strip()] = v.strip()
-    except FileNotFoundError:
-        pass
+@lru_cache(maxsize=4)
+def _read_env_file(path: str, mtime_ns: int, size: int) -> dict:
+    env_dict = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if '=' in line:
+                k, v = line.split('=', 1)
+                env_dict[k.strip()] = v.strip()
+    return env_dict
 
 def _parse_env_file(path: str = '.env') -> dict:
-    """Parse .env file and return dict without modifying os.environ."""
-    env_dict = {}
+    """Parse .env file and return dict without modifying os.environ.
+
+    The parse is cached until the file's mtime or size changes.
+    """
     try:
-        with open(path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    k, v = line.split('=', 1)
-                    env_dict[k.strip()] = v.strip()
+        st = os.stat(path)
+        return dict(_read_env_file(path, st.st_mtime_ns, st.st_size))
     except FileNotFoundError:
-        pass
-    return env_dict
+        return {}
+
+def _load_env_file(path: str = '.env'):
+    os.environ.update(_parse_env_file(path))
+
+def _is_api_key(key: str) -> bool:
+    """Check the OpenAI key format accepted from .env and from the admin panel."""
+    return key.startswith('sk-') and len(key) > 20
 
 def _validate_env_dict(env_dict: dict) -> bool:
     """Check if env dict has a valid OPENAI_API_KEY."""
-    key = env_dict.get('OPENAI_API_KEY', '')
-    return key.startswith('sk-') and len(key) > 20
+    return _is_api_key(env_dict.get('OPENAI_API_KEY', ''))
 
 def reload_env_if_valid() -> tuple:
     """
@@ -81,230 +134,649 @@ _load_env_file()
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-4')
 
-# Language executors
-def execute_python(code: str, test_args: list, problem_name: str) -> tuple:
-    """Execute Python code with test arguments."""
-    namespace = {}
-    stdout_capture = io.StringIO()
-    stderr_capture = io.StringIO()
-    
+# Persistent language runtimes
+RUNNERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runners')
+WORKERS_PER_LANGUAGE = int(os.environ.get('GLIDER_WORKERS', '2'))
+
+
+class _Worker:
+    """One long-lived runtime process answering one JSON line per request line."""
+
+    def __init__(self, argv: list):
+        self.proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            cwd=RUNNERS_DIR
+        )
+        self.replies = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self):
+        for line in self.proc.stdout:
+            self.replies.put(line)
+        self.replies.put(None)  # EOF: the runtime exited
+
+    def request(self, line: bytes, timeout: float) -> bytes:
+        self.proc.stdin.write(line + b'\n')
+        reply = self.replies.get(timeout=timeout)
+        if reply is None:
+            raise RuntimeError(f'worker exited with code {self.proc.wait()}')
+        return reply
+
+    def kill(self):
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+
+
+class WorkerPool:
+    """Pool of pre-started runtimes (Node, JVM, Python) so submissions skip process startup.
+
+    Each request is the full program source (a JSON request for Python), sent
+    base64-encoded on one line; the worker runs it and replies with one JSON
+    object whose status is 'ok', 'compile_error', 'runtime_error' or 'timeout'
+    (Python also reports 'error' for a failed exec).
+    A worker that times out or dies is killed and replaced on next use.
+    """
+
+    def __init__(self, argv: list, size: int = WORKERS_PER_LANGUAGE):
+        self.argv = argv
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max(1, size))
+
+    def submit(self, source: str, timeout: float = 5) -> dict:
+        line = base64.b64encode(source.encode('utf-8'))
+        with self._slots:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                worker = _Worker(self.argv)
+            try:
+                reply = worker.request(line, timeout)
+            except queue.Empty:
+                worker.kill()
+                raise subprocess.TimeoutExpired(self.argv, timeout)
+            except Exception:
+                worker.kill()
+                raise
+            self._idle.put(worker)
+        return json.loads(reply)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+# Scratch space for compiles: prefer a RAM-backed tmpfs so source/binary writes
+# never wait on disk. Respects GLIDER_SCRATCH; every concurrent compile holds a
+# few MB there, so size /dev/shm accordingly (Docker defaults it to 64 MB).
+def _is_tmpfs(path: str) -> bool:
+    """Return True if path lives on a tmpfs mount (per /proc/mounts)."""
     try:
-        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-            exec(code, namespace)
-            func = namespace.get(problem_name)
-            if not func:
-                raise NameError(f'Function {problem_name} not found')
-            result = func(*test_args)
-        return result, stdout_capture.getvalue(), stderr_capture.getvalue()
-    except Exception as e:
-        return None, stdout_capture.getvalue(), f'{type(e).__name__}: {e}'
+        with open('/proc/mounts') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    path = os.path.realpath(path)
+    mount_point, fstype = '', ''
+    for mp, fs in mounts:
+        if (path == mp or path.startswith(mp.rstrip('/') + '/')) and len(mp) > len(mount_point):
+            mount_point, fstype = mp, fs
+    return fstype == 'tmpfs'
+
+def _scratch_root() -> str:
+    for candidate in (os.environ.get('GLIDER_SCRATCH'), '/dev/shm', tempfile.gettempdir()):
+        if candidate and os.path.isdir(candidate) and _is_tmpfs(candidate):
+            return candidate
+    app.logger.warning('No tmpfs found for compile scratch space; falling back to %s', tempfile.gettempdir())
+    return tempfile.gettempdir()
+
+SCRATCH_ROOT = _scratch_root()
+
+def _private_dir(name: str) -> str:
+    """Return SCRATCH_ROOT/name as a directory only this user can write to.
+
+    SCRATCH_ROOT (/dev/shm, /tmp) is world-writable and the cached binaries in
+    here get executed, so a directory someone else owns (or a symlink) is never
+    used; a fresh private one is made next to it instead.
+    """
+    path = os.path.join(SCRATCH_ROOT, name)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if not hasattr(os, 'getuid'):
+        return path  # no POSIX owners or modes to check (Windows)
+    st = os.lstat(path)
+    if stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid():
+        if stat.S_IMODE(st.st_mode) & 0o077:
+            os.chmod(path, 0o700)  # ours, but made by a version that left it open
+        return path
+    app.logger.warning('%s is not a directory owned by this user; using a private one instead', path)
+    return tempfile.mkdtemp(prefix=f'{name}-', dir=SCRATCH_ROOT)
+
+SCRATCH_DIR = _private_dir('glider-scratch')
+
+# Java workers map a dynamic CDS archive of the JDK classes the dispatcher loads
+# (javac included), so a worker respawned after a timeout skips most class
+# loading. A throwaway dispatcher dumps it once, in the background, on first Java
+# use. JVMs without dynamic CDS (JDK < 13) ignore the options and run without it;
+# VM warnings go to stderr so they can't corrupt the reply stream.
+JAVA_CDS_ARCHIVE = os.path.join(SCRATCH_DIR, 'glider-java.jsa')
+JAVA_VM_OPTIONS = ['-XX:+IgnoreUnrecognizedVMOptions', '-XX:+DisplayVMOutputToStderr', '-Xshare:auto']
+_JAVA_CDS_STARTED = False
+_JAVA_CDS_LOCK = threading.Lock()
 
-def execute_javascript(code: str, test_args: list, problem_name: str) -> tuple:
-    """Execute JavaScript code with Node.js."""
-    temp_dir = tempfile.mkdtemp()
+def _dump_java_cds():
+    partial = f'{JAVA_CDS_ARCHIVE}.{os.getpid()}'
     try:
-        js_file = os.path.join(temp_dir, 'solution.js')
-        test_code = f"""{code}
+        subprocess.run(
+            ['java'] + JAVA_VM_OPTIONS + [f'-XX:ArchiveClassesAtExit={partial}',
+                                          os.path.join(RUNNERS_DIR, 'Dispatcher.java')],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=120,
+            cwd=RUNNERS_DIR
+        )
+        if os.path.exists(partial):
+            os.replace(partial, JAVA_CDS_ARCHIVE)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+def _ensure_java_cds():
+    """Kick off the CDS dump the first time Java is used, unless the archive exists."""
+    global _JAVA_CDS_STARTED
+    if _JAVA_CDS_STARTED:
+        return
+    with _JAVA_CDS_LOCK:
+        if not _JAVA_CDS_STARTED:
+            _JAVA_CDS_STARTED = True
+            if not os.path.exists(JAVA_CDS_ARCHIVE):
+                threading.Thread(target=_dump_java_cds, daemon=True).start()
+
+NODE_POOL = WorkerPool(['node', os.path.join(RUNNERS_DIR, 'runner.js'), '5000'])
+JAVA_POOL = WorkerPool(['java'] + JAVA_VM_OPTIONS + [f'-XX:SharedArchiveFile={JAVA_CDS_ARCHIVE}',
+                                                     os.path.join(RUNNERS_DIR, 'Dispatcher.java')])
+PYTHON_POOL = WorkerPool([sys.executable, os.path.join(RUNNERS_DIR, 'py_runner.py')])
+atexit.register(NODE_POOL.close)
+atexit.register(JAVA_POOL.close)
+atexit.register(PYTHON_POOL.close)
+
+# Route g++ through ccache when available; keep its cache in RAM if possible
+CXX = ['ccache', 'g++'] if shutil.which('ccache') else ['g++']
+CXX_ENV = dict(os.environ)
+if _is_tmpfs(SCRATCH_ROOT):
+    if CXX[0] == 'ccache' and 'CCACHE_DIR' not in CXX_ENV:
+        CXX_ENV['CCACHE_DIR'] = _private_dir('glider-ccache')
+    CXX_ENV['TMPDIR'] = SCRATCH_DIR  # g++'s own temporaries (.o, and .s without -pipe)
+CXX_ENV.setdefault('CCACHE_SLOPPINESS', 'pch_defines,time_macros')
+
+# Flags shared by the precompiled harness header and every submission compile;
+# GCC silently ignores a .gch built with different options. Exceptions and RTTI
+# stay on: the harness catches per-test exceptions and learners may use typeid.
+CXX_FLAGS = ['-std=c++17', '-O0', '-pipe', '-fno-asynchronous-unwind-tables', '-w']
+CPP_PRELUDE = r"""#include <cmath>
+#include <iostream>
+#include <vector>
+#include <string>
+#include <sstream>
+using namespace std;
+
+// Harness output: every RESULT is printed as JSON
+inline void glider_json(ostream& os, const string& s) {
+    const char* hex = "0123456789abcdef";
+    os << '"';
+    for (char c : s) {
+        unsigned char u = static_cast<unsigned char>(c);
+        if (c == '"' || c == '\\') os << '\\' << c;
+        else if (u < 0x20) os << "\\u00" << hex[u >> 4] << hex[u & 15];
+        else os << c;
+    }
+    os << '"';
+}
+inline void glider_json(ostream& os, const char* s) { glider_json(os, string(s)); }
+inline void glider_json(ostream& os, char c) { glider_json(os, string(1, c)); }
+inline void glider_json(ostream& os, bool b) { os << (b ? "true" : "false"); }
+inline void glider_json(ostream& os, double d) {
+    if (std::isnan(d)) os << "NaN";
+    else if (std::isinf(d)) os << (d > 0 ? "Infinity" : "-Infinity");
+    else os << d;
+}
+template <class T> void glider_json(ostream& os, const T& v) { os << v; }
+template <class T> void glider_json(ostream& os, const vector<T>& v) {
+    os << '[';
+    for (size_t i = 0; i < v.size(); ++i) {
+        if (i) os << ", ";
+        glider_json(os, v[i]);
+    }
+    os << ']';
+}
+"""
+_PCH_HEADER = None  # harness.h path once its .gch is built, '' if that failed
+_PCH_LOCK = threading.Lock()
+
+def _pch_header() -> Optional[str]:
+    """Precompile CPP_PRELUDE once per process; return the header to -include, or None."""
+    global _PCH_HEADER
+    if _PCH_HEADER is None:
+        with _PCH_LOCK:
+            if _PCH_HEADER is None:
+                suffix = f'.{os.getpid()}'
+                try:
+                    header = os.path.join(_private_dir('glider-pch'), 'harness.h')
+                    with open(header + suffix, 'w') as f:
+                        f.write(CPP_PRELUDE)
+                    os.replace(header + suffix, header)
+                    proc = subprocess.run(
+                        ['g++'] + CXX_FLAGS + ['-x', 'c++-header', header, '-o', header + '.gch' + suffix],
+                        capture_output=True,
+                        timeout=60
+                    )
+                    if proc.returncode == 0:
+                        os.replace(header + '.gch' + suffix, header + '.gch')
+                    _PCH_HEADER = header if proc.returncode == 0 else ''
+                except (OSError, subprocess.TimeoutExpired):
+                    _PCH_HEADER = ''
+    return _PCH_HEADER or None
+
+# Content-addressed cache of compiled C++ binaries: sha256(source) -> executable.
+# (Java keeps its equivalent cache of compiled classes inside the JVM worker.)
+COMPILE_CACHE_DIR = _private_dir('glider-cache')
+COMPILE_CACHE_SIZE = 500
+_COMPILE_CACHE = OrderedDict()
+_COMPILE_CACHE_LOCK = threading.Lock()
+
+def _cleanup(directory: str, files, remove_dir: bool = False):
+    """Unlink the known files in directory (and optionally the directory) without scanning it."""
+    for name in files:
+        try:
+            os.unlink(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+    if remove_dir:
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass  # another worker is building into this slot
+
+def _compile_cache_path(key: str) -> str:
+    return os.path.join(COMPILE_CACHE_DIR, key, 'solution.exe' if os.name == 'nt' else 'solution')
+
+def _compile_cache_get(key: str) -> Optional[str]:
+    """Return the cached executable for key (possibly built by another worker), or None."""
+    path = _compile_cache_path(key)
+    if not os.path.exists(path):
+        return None
+    with _COMPILE_CACHE_LOCK:
+        _COMPILE_CACHE[key] = path
+        _COMPILE_CACHE.move_to_end(key)
+    return path
+
+def _compile_cache_put(key: str, built: str) -> str:
+    """Atomically move a freshly built executable into the cache, evicting LRU entries."""
+    path = _compile_cache_path(key)
+    os.replace(built, path)
+    with _COMPILE_CACHE_LOCK:
+        _COMPILE_CACHE[key] = path
+        _COMPILE_CACHE.move_to_end(key)
+        while len(_COMPILE_CACHE) > COMPILE_CACHE_SIZE:
+            _, stale = _COMPILE_CACHE.popitem(last=False)
+            _cleanup(os.path.dirname(stale), (os.path.basename(stale),), remove_dir=True)
+    return path
+
+# Language executors
+#
+# Every executor takes the user's code, a list of per-test argument tuples and
+# the function name, and runs all tests in a single program invocation. It
+# returns one outcome per test: a (result, stdout, stderr) tuple, or the
+# exception that test raised. Problems that fail the whole batch (syntax or
+# compile errors, timeouts) are raised instead.
+
+_MARKER_RE = re.compile(r'^(RESULT|ERROR):(.*)$', re.MULTILINE)
+
+def _collect_results(output: str, stderr: str, count: int, parse, error: str) -> list:
+    """Split batched harness output into one outcome per test.
+
+    The harness prints a RESULT:<value> or ERROR:<message> line after each
+    test; whatever the test printed before that line is its stdout. Tests the
+    program never reached are reported as RuntimeError(error).
+    """
+    outcomes = []
+    pos = 0
+    for m in _MARKER_RE.finditer(output):
+        captured = output[pos:m.start()]
+        pos = m.end() + 1
+        if m.group(1) == 'ERROR':
+            outcomes.append(RuntimeError(m.group(2)))
+        else:
+            try:
+                outcomes.append((parse(m.group(2)), captured, stderr))
+            except ValueError as e:
+                outcomes.append(e)
+        if len(outcomes) == count:
+            return outcomes
+    while len(outcomes) < count:
+        outcomes.append(RuntimeError(error))
+    return outcomes
+
+@lru_cache(maxsize=256)
+def _remote_exception_type(error_type: str) -> type:
+    """An exception class named error_type whose str() is the runner's message as sent."""
+    base = getattr(builtins, error_type, None)
+    if not (isinstance(base, type) and issubclass(base, Exception)):
+        base = Exception
+    return type(error_type, (base,), {'__str__': lambda self: self.args[0] if self.args else ''})
+
+def _remote_exception(error_type: str, message: str, args: Optional[str] = None) -> Exception:
+    """Rebuild an exception reported by a runner under its original type name.
+
+    Builtin types sent with literal args are re-raised from those args, so
+    KeyError('x') reads the same as in-process; anything else keeps message.
+    """
+    exc_type = getattr(builtins, error_type, None)
+    if args is not None and isinstance(exc_type, type) and issubclass(exc_type, Exception):
+        try:
+            return exc_type(*ast.literal_eval(args))
+        except Exception:
+            pass
+    return _remote_exception_type(error_type)(message)
+
+def execute_python(code: str, tests: list, problem_name: str) -> list:
+    """Execute Python code in a resource-limited child of a pooled Python worker."""
+    request_json = json.dumps({'code': code, 'tests': tests, 'fn': problem_name})
+    reply = PYTHON_POOL.submit(request_json, timeout=6)
+    if reply['status'] == 'timeout':
+        raise subprocess.TimeoutExpired('python', 5)
+    if reply['status'] != 'ok':
+        raise _remote_exception(reply['error_type'], reply['error'], reply.get('args'))
+
+    outcomes = []
+    for outcome in reply['outcomes']:
+        if 'error_type' in outcome:
+            outcomes.append(_remote_exception(outcome['error_type'], outcome['error'], outcome.get('args')))
+        else:
+            if 'repr' in outcome:
+                result = ast.literal_eval(outcome['repr'])
+            else:
+                result = outcome['result'] if 'result' in outcome else outcome['str']
+            outcomes.append((result, outcome['stdout'], outcome['stderr']))
+    return outcomes
+
+def execute_javascript(code: str, tests: list, problem_name: str) -> list:
+    """Execute JavaScript code on a pooled Node.js worker."""
+    test_code = f"""{code}
 
 // Test harness
-const args = {json.dumps(test_args)};
-const result = {problem_name}(...args);
-console.log('RESULT:' + JSON.stringify(result));
+for (const args of [{', '.join(_arg_literal('javascript', args) for args in tests)}]) {{
+    try {{
+        const result = {problem_name}(...args);
+        console.log('RESULT:' + JSON.stringify(result));
+    }} catch (e) {{
+        console.log('ERROR:' + String(e).replace(/\\n/g, ' '));
+    }}
+}}
 """
-        with open(js_file, 'w') as f:
-            f.write(test_code)
-        
-        proc = subprocess.run(
-            ['node', js_file],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if proc.returncode != 0:
-            raise RuntimeError(f'JavaScript error: {proc.stderr}')
-        
-        output = proc.stdout
-        for line in output.split('\n'):
-            if line.startswith('RESULT:'):
-                result_str = line[7:]
-                result = json.loads(result_str)
-                return result, output, proc.stderr
-        
-        raise RuntimeError(f'Could not find RESULT in output: {output}')
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    reply = NODE_POOL.submit(test_code, timeout=6)
+    if reply['status'] == 'timeout':
+        raise subprocess.TimeoutExpired('node', 5)
+    if reply['status'] != 'ok':
+        raise RuntimeError(f'JavaScript error: {reply["stderr"]}')
 
-def execute_java(code: str, test_args: list, problem_name: str) -> tuple:
-    """Execute Java code by compiling and running."""
-    temp_dir = tempfile.mkdtemp()
-    try:
-        java_file = os.path.join(temp_dir, 'TestRunner.java')
-        
-        # Build test harness - simpler approach without external dependencies
-        # Convert Python args to Java literals
-        def python_to_java(val):
-            if isinstance(val, bool):
-                return 'true' if val else 'false'
-            elif isinstance(val, str):
-                # Escape quotes and backslashes
-                escaped = val.replace('\\', '\\\\').replace('"', '\\"')
-                return f'"{escaped}"'
-            elif isinstance(val, (int, float)):
-                return str(val)
-            elif isinstance(val, (list, tuple)):
-                items = ', '.join(python_to_java(v) for v in val)
-                return f'new Object[]{{{items}}}'
-            return str(val)
-        
-        java_args = ', '.join(python_to_java(arg) for arg in test_args)
-        
-        test_code = f"""
+    return _collect_results(reply['stdout'], reply['stderr'], len(tests), json.loads,
+                            f'Could not find RESULT in output: {reply["stdout"]}')
+
+# Python test args -> Java / C++ source literals, dispatched on the exact type
+# (so bool is never mistaken for int); anything else falls back to str().
+_STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+def _string_literal(val: str) -> str:
+    return f'"{val.translate(_STRING_ESCAPES)}"'
+
+def _bool_literal(val: bool) -> str:
+    return 'true' if val else 'false'
+
+def _java_array_literal(val) -> str:
+    return f"new Object[]{{{', '.join(map(python_to_java, val))}}}"
+
+_CPP_LITERALS = {bool: _bool_literal, str: _string_literal, int: str, float: str}
+_JAVA_LITERALS = {**_CPP_LITERALS, list: _java_array_literal, tuple: _java_array_literal}
+
+def python_to_java(val) -> str:
+    return _JAVA_LITERALS.get(type(val), str)(val)
+
+def python_to_cpp(val) -> str:
+    return _CPP_LITERALS.get(type(val), str)(val)
+
+# One test's args as harness source, per language. Literals for the catalog's
+# tests are precomputed at load and found by identity (the catalog keeps every
+# args tuple alive, so its id can't be reused); other args are converted here.
+_ARG_CONVERTERS = {
+    'javascript': json.dumps,
+    'java': lambda args: ', '.join(map(python_to_java, args)),
+    'cpp': lambda args: ', '.join(map(python_to_cpp, args)),
+}
+_ARG_LITERALS = {}
+
+def _arg_literal(language: str, args: tuple) -> str:
+    entry = _ARG_LITERALS.get(id(args))
+    if entry is not None and entry[0] is args:
+        return entry[1][language]
+    return _ARG_CONVERTERS[language](args)
+
+# Added to TestRunner so every RESULT is printed as JSON (arrays and lists
+# included, which would otherwise print as e.g. [I@1b6d3586)
+JAVA_JSON_HELPER = r"""
+    static String json(Object o) {
+        if (o == null) return "null";
+        if (o instanceof CharSequence || o instanceof Character) {
+            StringBuilder sb = new StringBuilder("\"");
+            for (char c : o.toString().toCharArray()) {
+                if (c == '"' || c == '\\') sb.append('\\').append(c);
+                else if (c < 0x20) sb.append(String.format("\\u%04x", (int) c));
+                else sb.append(c);
+            }
+            return sb.append('"').toString();
+        }
+        if (o instanceof Double || o instanceof Float) {
+            double d = ((Number) o).doubleValue();
+            if (Double.isNaN(d)) return "NaN";
+            if (Double.isInfinite(d)) return d > 0 ? "Infinity" : "-Infinity";
+            return o.toString();
+        }
+        StringBuilder sb = new StringBuilder("[");
+        if (o.getClass().isArray()) {
+            for (int i = 0; i < java.lang.reflect.Array.getLength(o); i++) {
+                sb.append(i > 0 ? ", " : "").append(json(java.lang.reflect.Array.get(o, i)));
+            }
+            return sb.append(']').toString();
+        }
+        if (o instanceof Iterable) {
+            for (Object item : (Iterable<?>) o) {
+                sb.append(sb.length() > 1 ? ", " : "").append(json(item));
+            }
+            return sb.append(']').toString();
+        }
+        if (o instanceof java.util.Map) {
+            sb.setCharAt(0, '{');
+            for (java.util.Map.Entry<?, ?> e : ((java.util.Map<?, ?>) o).entrySet()) {
+                sb.append(sb.length() > 1 ? ", " : "")
+                  .append(json(String.valueOf(e.getKey()))).append(": ").append(json(e.getValue()));
+            }
+            return sb.append('}').toString();
+        }
+        return o.toString();
+    }
+"""
+
+def execute_java(code: str, tests: list, problem_name: str) -> list:
+    """Execute Java code on a pooled JVM that compiles it in memory."""
+    # Build test harness - simpler approach without external dependencies
+    calls = []
+    for test_args in tests:
+        java_args = _arg_literal('java', test_args)
+        calls.append(f"""        try {{
+            Object result = new Solution().{problem_name}({java_args});
+            System.out.println("RESULT:" + json(result));
+        }} catch (Throwable e) {{
+            e.printStackTrace();
+            System.out.println("ERROR:" + String.valueOf(e).replace('\\n', ' '));
+        }}""")
+    calls = '\n'.join(calls)
+
+    test_code = f"""
 {code.replace('public class', 'class')}
 
 public class TestRunner {{
     public static void main(String[] args) {{
-        Solution sol = new Solution();
-        Object result = sol.{problem_name}({java_args});
-        System.out.println("RESULT:" + result);
+{calls}
     }}
-}}
+{JAVA_JSON_HELPER}}}
 """
-        with open(java_file, 'w') as f:
+    _ensure_java_cds()
+    # Compile + run share the old javac (10s) and java (5s) budgets
+    reply = JAVA_POOL.submit(test_code, timeout=15)
+    if reply['status'] == 'compile_error':
+        raise RuntimeError(f'Java compilation error: {reply["stderr"]}')
+    if reply['status'] != 'ok':
+        raise RuntimeError(f'Java runtime error: {reply["stderr"]}')
+
+    return _collect_results(reply['stdout'], reply['stderr'], len(tests), json.loads,
+                            f'Could not find RESULT in output: {reply["stdout"]}')
+
+_SCRATCH_SLOTS = threading.local()
+
+def _scratch_slot() -> str:
+    """Return this thread's scratch directory, created once and reused across compiles."""
+    slot = getattr(_SCRATCH_SLOTS, 'path', None)
+    if slot is None:
+        slot = os.path.join(SCRATCH_DIR, f'{os.getpid()}-{threading.get_ident()}')
+        os.makedirs(slot, exist_ok=True)
+        _SCRATCH_SLOTS.path = slot
+    return slot
+
+def _compile_cpp(test_code: str, key: str, pch: Optional[str]) -> str:
+    """Compile test_code with g++ (on top of the pch header, if any) and return the cached executable."""
+    temp_dir = _scratch_slot()
+    cpp_file = os.path.join(temp_dir, 'solution.cpp')
+    log_file = os.path.join(temp_dir, 'compile.log')
+    # Compile next to the cache slot so the final move is an atomic rename
+    exe_file = _compile_cache_path(key)
+    built = f'{exe_file}.{os.getpid()}.{threading.get_ident()}'
+    try:
+        with open(cpp_file, 'w') as f:
             f.write(test_code)
-        
-        # Compile
-        compile_proc = subprocess.run(
-            ['javac', java_file],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=temp_dir
-        )
-        
-        if compile_proc.returncode != 0:
-            raise RuntimeError(f'Java compilation error: {compile_proc.stderr}')
-        
-        # Run
-        run_proc = subprocess.run(
-            ['java', '-cp', temp_dir, 'TestRunner'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if run_proc.returncode != 0:
-            raise RuntimeError(f'Java runtime error: {run_proc.stderr}')
-        
-        output = run_proc.stdout
-        for line in output.split('\n'):
-            if line.startswith('RESULT:'):
-                result_str = line[7:].strip()
-                # Parse result
-                try:
-                    # Try to parse as number
-                    if '.' in result_str:
-                        result = float(result_str)
-                    else:
-                        result = int(result_str)
-                except ValueError:
-                    # Handle boolean or string
-                    if result_str.lower() == 'true':
-                        result = True
-                    elif result_str.lower() == 'false':
-                        result = False
-                    else:
-                        result = result_str
-                return result, output, run_proc.stderr
-        
-        raise RuntimeError(f'Could not find RESULT in output: {output}')
+        os.makedirs(os.path.dirname(exe_file), exist_ok=True)
+        # Diagnostics go straight to a tmpfs file that is only read if g++ fails,
+        # so a clean compile costs no pipe reads at all
+        with open(log_file, 'w+') as log:
+            compile_proc = subprocess.run(
+                CXX + CXX_FLAGS + (['-include', pch] if pch else []) + [cpp_file, '-o', built],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=log,
+                timeout=10,
+                env=CXX_ENV
+            )
+            if compile_proc.returncode != 0:
+                log.seek(0)
+                raise RuntimeError(f'C++ compilation error: {log.read()}')
+        return _compile_cache_put(key, built)
     finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        _cleanup(temp_dir, ('solution.cpp', 'compile.log'))
+        # A killed g++ leaves a partial binary; a failed build leaves an empty slot
+        # (rmdir is a no-op once the executable has been moved in)
+        _cleanup(os.path.dirname(built), (os.path.basename(built),), remove_dir=True)
+
+def _run_until_results(argv: list, count: int, timeout: float) -> tuple:
+    """Run a harness program on one merged stdout/stderr pipe until every test has reported.
 
-def execute_cpp(code: str, test_args: list, problem_name: str) -> tuple:
-    """Execute C++ code by compiling with g++."""
-    temp_dir = tempfile.mkdtemp()
+    The program is killed as soon as the count-th RESULT/ERROR line arrives,
+    so it is not waited on past its last test. Returns (output, tail,
+    returncode): tail is whatever followed the last marker (a crash message,
+    usually) and returncode is None if the timeout fired first.
+    """
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors='replace'
+    )
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    lines = []
+    tail_start = 0
+    seen = 0
     try:
-        cpp_file = os.path.join(temp_dir, 'solution.cpp')
-        exe_file = os.path.join(temp_dir, 'solution.exe' if os.name == 'nt' else 'solution')
-        
-        # Convert Python args to C++ literals
-        def python_to_cpp(val):
-            if isinstance(val, bool):
-                return 'true' if val else 'false'
-            elif isinstance(val, str):
-                # Escape quotes and backslashes
-                escaped = val.replace('\\', '\\\\').replace('"', '\\"')
-                return f'"{escaped}"'
-            elif isinstance(val, (int, float)):
-                return str(val)
-            return str(val)
-        
-        cpp_args = ', '.join(python_to_cpp(arg) for arg in test_args)
-        
-        test_code = f"""
-#include <iostream>
-#include <vector>
-#include <string>
-#include <sstream>
-using namespace std;
+        for line in proc.stdout:
+            lines.append(line)
+            if line.startswith(('RESULT:', 'ERROR:')):
+                tail_start = len(lines)
+                seen += 1
+                if seen == count:
+                    proc.kill()
+                    break
+        proc.stdout.close()
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    if seen < count and returncode == -getattr(signal, 'SIGKILL', 9):
+        returncode = None
+    return ''.join(lines), ''.join(lines[tail_start:]), returncode
 
+def execute_cpp(code: str, tests: list, problem_name: str) -> list:
+    """Execute C++ code by compiling with g++ (or reusing a cached binary)."""
+    calls = []
+    for test_args in tests:
+        cpp_args = _arg_literal('cpp', test_args)
+        calls.append(f"""    try {{
+        auto result = {problem_name}({cpp_args});
+        cout << "RESULT:";
+        glider_json(cout, result);
+        cout << endl;
+    }} catch (const exception& e) {{
+        cout << "ERROR:" << e.what() << endl;
+    }} catch (...) {{
+        cout << "ERROR:unknown exception" << endl;
+    }}""")
+    calls = '\n'.join(calls)
+    
+    # With the precompiled header the includes come from -include instead
+    pch = _pch_header()
+    test_code = f"""
+{'' if pch else CPP_PRELUDE}
 {code}
 
 int main() {{
-    auto result = {problem_name}({cpp_args});
-    cout << "RESULT:" << result << endl;
+{calls}
     return 0;
 }}
 """
-        with open(cpp_file, 'w') as f:
-            f.write(test_code)
-        
-        # Compile
-        compile_proc = subprocess.run(
-            ['g++', '-std=c++17', cpp_file, '-o', exe_file],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if compile_proc.returncode != 0:
-            raise RuntimeError(f'C++ compilation error: {compile_proc.stderr}')
-        
-        # Run
-        run_proc = subprocess.run(
-            [exe_file],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if run_proc.returncode != 0:
-            raise RuntimeError(f'C++ runtime error: {run_proc.stderr}')
-        
-        # Parse result
-        output = run_proc.stdout
-        for line in output.split('\n'):
-            if line.startswith('RESULT:'):
-                result_str = line[7:].strip()
-                try:
-                    if '.' in result_str:
-                        result = float(result_str)
-                    else:
-                        result = int(result_str)
-                except ValueError:
-                    # Handle boolean or string
-                    if result_str == '1':
-                        result = True
-                    elif result_str == '0':
-                        result = False
-                    else:
-                        result = result_str
-                return result, output, run_proc.stderr
-        
-        raise RuntimeError(f'Could not find RESULT in output: {output}')
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    key = hashlib.sha256(test_code.encode('utf-8')).hexdigest()
+    output = None
+    exe_file = _compile_cache_get(key)
+    if exe_file is not None:
+        try:
+            output, tail, returncode = _run_until_results([exe_file], len(tests), timeout=5)
+        except OSError:
+            pass  # evicted by another worker since the lookup, or unrunnable: rebuild
+    if output is None:
+        exe_file = _compile_cpp(test_code, key, pch)
+        output, tail, returncode = _run_until_results([exe_file], len(tests), timeout=5)
+
+    # A crash or timeout only fails the tests that had not reported yet
+    if returncode is None:
+        error = 'C++ program timed out after 5 seconds'
+    elif returncode != 0:
+        error = f'C++ runtime error: {tail}'
+    else:
+        error = f'Could not find RESULT in output: {output}'
+    return _collect_results(output, '', len(tests), json.loads, error)
 
 
 LANGUAGE_EXECUTORS = {
@@ -314,792 +786,200 @@ LANGUAGE_EXECUTORS = {
     'cpp': execute_cpp
 }
 
+# Concurrent executions (across all requests in this process) are capped so a
+# burst of submissions can't fork more runtimes than there are cores.
+MAX_INFLIGHT = int(os.environ.get('GLIDER_MAX_INFLIGHT', str(os.cpu_count() or 2)))
+_INFLIGHT = threading.BoundedSemaphore(MAX_INFLIGHT)
+_BATCH_POOL = ThreadPoolExecutor(max_workers=MAX_INFLIGHT, thread_name_prefix='glider-batch')
+BATCH_TIMEOUT = 30
 
-PROBLEMS = {
-    'summation': {
-        'name': 'summation',
-        'title': 'Sum of Two Integers',
-        'description': 'Implement summation(a, b) that returns the sum of two integers.',
-        'signature': 'def summation(a, b):',
-        'stubs': {
-            'python': 'def summation(a, b):\n    # Write your code here\n    pass\n',
-            'javascript': 'function summation(a, b) {\n    // Write your code here\n}\n',
-            'java': 'public class Solution {\n    public int summation(int a, int b) {\n        // Write your code here\n        return 0;\n    }\n}\n',
-            'cpp': 'int summation(int a, b) {\n    // Write your code here\n    return 0;\n}\n'
-        },
-        'tests': [
-            {'args': (2, 3), 'expected': 5},
-            {'args': (-1, 1), 'expected': 0},
-            {'args': (0, 0), 'expected': 0},
-        ]
-    },
-    'palindrome': {
-        'name': 'palindrome',
-        'title': 'Is Palindrome',
-        'description': 'Implement is_palindrome(s) that checks if a string is a palindrome (ignore non-alphanumeric, case-insensitive).',
-        'signature': 'def is_palindrome(s):',
-        'stubs': {
-            'python': 'def is_palindrome(s):\n    # Write your code here\n    pass\n',
-            'javascript': 'function is_palindrome(s) {\n    // Write your code here\n}\n',
-            'java': 'public class Solution {\n    public boolean is_palindrome(String s) {\n        // Write your code here\n        return false;\n    }\n}\n',
-            'cpp': 'bool is_palindrome(string s) {\n    // Write your code here\n    return false;\n}\n'
-        },
-        'tests': [
-            {'args': ("A man, a plan, a canal: Panama",), 'expected': True},
-            {'args': ("race a car",), 'expected': False},
-            {'args': ("",), 'expected': True},
-        ]
-    },
-    'second_largest': {
-        'name': 'second_largest',
-        'title': 'Second Largest',
-        'description': 'Implement second_largest(nums) that returns the second largest distinct integer, or None if it doesn\'t exist.',
-        'signature': 'def second_largest(nums):',
-        'tests': [
-            {'args': ([2, 3, 1],), 'expected': 2},
-            {'args': ([5, 5, 5],), 'expected': None},
-            {'args': ([-1, -2, -3],), 'expected': -2},
-        ]
-    },
-    'frequency_sort': {
-        'name': 'frequency_sort',
-        'title': 'Frequency Sort',
-        'description': 'Implement frequency_sort(s) that sorts characters by frequency (desc), then alphabetically (asc).',
-        'signature': 'def frequency_sort(s):',
-        'tests': [
-            {'args': ("tree",), 'expected': "eert"},
-            {'args': ("cccaaa",), 'expected': "aaaccc"},
-            {'args': ("",), 'expected': ""},
-        ]
-    },
-    'merge_intervals': {
-        'name': 'merge_intervals',
-        'title': 'Merge Intervals',
-        'description': 'Implement merge_intervals(intervals) that merges overlapping intervals.',
-        'signature': 'def merge_intervals(intervals):',
-        'tests': [
-            {'args': ([[1,3],[2,6],[8,10],[15,18]],), 'expected': [[1,6],[8,10],[15,18]]},
-            {'args': ([[1,4],[4,5]],), 'expected': [[1,5]]},
-            {'args': ([],), 'expected': []},
-        ]
-    },
-    'two_sum': {
-        'name': 'two_sum',
-        'title': 'Two Sum',
-        'description': 'Implement two_sum(nums, target) that returns indices [i,j] summing to target, or [-1,-1].',
-        'signature': 'def two_sum(nums, target):',
-        'stubs': {
-            'python': 'def two_sum(nums, target):\n    # Write your code here\n    pass\n',
-            'javascript': 'function two_sum(nums, target) {\n    // Write your code here\n}\n',
-            'java': 'public class Solution {\n    public int[] two_sum(int[] nums, int target) {\n        // Write your code here\n        return new int[]{-1, -1};\n    }\n}\n',
-            'cpp': 'vector<int> two_sum(vector<int>& nums, int target) {\n    // Write your code here\n    return {-1, -1};\n}\n'
-        },
-        'tests': [
-            {'args': ([2,7,11,15], 9), 'expected': [0,1]},
-            {'args': ([3,2,4], 6), 'expected': [1,2]},
-            {'args': ([3,3], 6), 'expected': [0,1]},
-            {'args': ([1,2,3], 10), 'expected': [-1,-1]},
-        ]
-    },
-    'balanced_brackets': {
-        'name': 'balanced_brackets',
-        'title': 'Balanced Brackets',
-        'description': 'Implement balanced_brackets(s) that checks if brackets are balanced: (), {}, []',
-        'signature': 'def balanced_brackets(s):',
-        'tests': [
-            {'args': ("()[]{}",), 'expected': True},
-            {'args': ("(]",), 'expected': False},
-            {'args': ("([{}])",), 'expected': True},
-        ]
-    },
-    # --- Added harder problems below ---
-    'max_subarray': {
-        'name': 'max_subarray',
-        'title': 'Maximum Subarray Sum',
-        'description': 'Implement max_subarray(nums) returning the maximum possible subarray sum (Kadane\'s algorithm).',
-        'signature': 'def max_subarray(nums):',
-        'tests': [
-            {'args': ([-2,1,-3,4,-1,2,1,-5,4],), 'expected': 6},  # [4,-1,2,1]
-            {'args': ([1],), 'expected': 1},
-            {'args': ([-1,-2,-3],), 'expected': -1},
-        ]
-    },
-    'product_except_self': {
-        'name': 'product_except_self',
-        'title': 'Product of Array Except Self',
-        'description': 'Implement product_except_self(nums) without using division, return an array where each element is the product of all other elements.',
-        'signature': 'def product_except_self(nums):',
-        'tests': [
-            {'args': ([1,2,3,4],), 'expected': [24,12,8,6]},
-            {'args': ([0,1,2,3],), 'expected': [6,0,0,0]},
-        ]
-    },
-    'three_sum': {
-        'name': 'three_sum',
-        'title': '3Sum',
-        'description': 'Implement three_sum(nums) returning a list of unique triplets [a,b,c] such that a+b+c=0. Order of triplets and elements within triplets does not matter.',
-        'signature': 'def three_sum(nums):',
-        'tests': [
-            {'args': ([-1,0,1,2,-1,-4],), 'expected': [[-1,-1,2],[-1,0,1]]},
-            {'args': ([0,1,1],), 'expected': []},
-        ]
-    },
-    'two_sum_sorted': {
-        'name': 'two_sum_sorted',
-        'title': 'Two Sum II (Sorted)',
-        'description': 'Implement two_sum_sorted(nums, target) where nums is sorted ascending, return 0-based indices [i,j] or [-1,-1].',
-        'signature': 'def two_sum_sorted(nums, target):',
-        'tests': [
-            {'args': ([2,7,11,15], 9), 'expected': [0,1]},
-            {'args': ([1,2,3,4,4,9], 8), 'expected': [3,4]},
-        ]
-    },
-    'longest_substring_without_repeating_characters': {
-        'name': 'longest_substring_without_repeating_characters',
-        'title': 'Longest Substring Without Repeating Characters',
-        'description': 'Implement longest_substring_without_repeating_characters(s) and return its length.',
-        'signature': 'def longest_substring_without_repeating_characters(s):',
-        'tests': [
-            {'args': ("abcabcbb",), 'expected': 3},
-            {'args': ("bbbbb",), 'expected': 1},
-            {'args': ("pwwkew",), 'expected': 3},
-        ]
-    },
-    'group_anagrams': {
-        'name': 'group_anagrams',
-        'title': 'Group Anagrams',
-        'description': 'Implement group_anagrams(strs) that groups words that are anagrams. Return groups sorted internally and externally for determinism.',
-        'signature': 'def group_anagrams(strs):',
-        'tests': [
-            {'args': ((["eat","tea","tan","ate","nat","bat"]).copy(),), 'expected': [["ate","eat","tea"],["nat","tan"],["bat"]]},
-        ]
-    },
-    'top_k_frequent': {
-        'name': 'top_k_frequent',
-        'title': 'Top K Frequent Elements',
-        'description': 'Implement top_k_frequent(nums, k) returning a list of k most frequent elements (any order acceptable, but sort ascending for determinism).',
-        'signature': 'def top_k_frequent(nums, k):',
-        'tests': [
-            {'args': ([1,1,1,2,2,3], 2), 'expected': [1,2]},
-            {'args': ([4,1,-1,2,-1,2,3], 2), 'expected': [-1,2]},
-        ]
-    },
-    'kth_largest': {
-        'name': 'kth_largest',
-        'title': 'Kth Largest Element',
-        'description': 'Implement kth_largest(nums, k) returning the k-th largest element in the array.',
-        'signature': 'def kth_largest(nums, k):',
-        'tests': [
-            {'args': ([3,2,1,5,6,4], 2), 'expected': 5},
-            {'args': ([3,2,3,1,2,4,5,5,6], 4), 'expected': 4},
-        ]
-    },
-    'binary_search': {
-        'name': 'binary_search',
-        'title': 'Binary Search',
-        'description': 'Implement binary_search(nums, target) returning index or -1. nums is sorted ascending.',
-        'signature': 'def binary_search(nums, target):',
-        'tests': [
-            {'args': ([1,2,3,4,5], 4), 'expected': 3},
-            {'args': ([1,2,3,4,5], 6), 'expected': -1},
-        ]
-    },
-    'search_rotated_sorted_array': {
-        'name': 'search_rotated_sorted_array',
-        'title': 'Search in Rotated Sorted Array',
-        'description': 'Implement search_rotated_sorted_array(nums, target) returning index or -1.',
-        'signature': 'def search_rotated_sorted_array(nums, target):',
-        'tests': [
-            {'args': ([4,5,6,7,0,1,2], 0), 'expected': 4},
-            {'args': ([4,5,6,7,0,1,2], 3), 'expected': -1},
-        ]
-    },
-    'max_product_subarray': {
-        'name': 'max_product_subarray',
-        'title': 'Maximum Product Subarray',
-        'description': 'Implement max_product_subarray(nums) returning the maximum product of a contiguous subarray.',
-        'signature': 'def max_product_subarray(nums):',
-        'tests': [
-            {'args': ([2,3,-2,4],), 'expected': 6},
-            {'args': ([-2,0,-1],), 'expected': 0},
-        ]
-    },
-    'coin_change': {
-        'name': 'coin_change',
-        'title': 'Coin Change (Min Coins)',
-        'description': 'Implement coin_change(coins, amount) to return the minimum number of coins to make up amount, or -1 if not possible.',
-        'signature': 'def coin_change(coins, amount):',
-        'tests': [
-            {'args': ([1,2,5], 11), 'expected': 3},
-            {'args': ([2], 3), 'expected': -1},
-        ]
-    },
-    'climb_stairs': {
-        'name': 'climb_stairs',
-        'title': 'Climbing Stairs',
-        'description': 'Implement climb_stairs(n) where you can climb 1 or 2 steps at a time; return number of distinct ways.',
-        'signature': 'def climb_stairs(n):',
-        'tests': [
-            {'args': (2,), 'expected': 2},
-            {'args': (3,), 'expected': 3},
-        ]
-    },
-    'min_window_substring': {
-        'name': 'min_window_substring',
-        'title': 'Minimum Window Substring',
-        'description': 'Implement min_window_substring(s, t) returning the smallest substring of s that contains all chars of t (with multiplicity). Return "" if none.',
-        'signature': 'def min_window_substring(s, t):',
-        'tests': [
-            {'args': ("ADOBECODEBANC", "ABC"), 'expected': "BANC"},
-            {'args': ("a", "aa"), 'expected': ""},
-        ]
-    },
-    'longest_palindromic_substring': {
-        'name': 'longest_palindromic_substring',
-        'title': 'Longest Palindromic Substring',
-        'description': 'Implement longest_palindromic_substring(s) returning one longest palindromic substring.',
-        'signature': 'def longest_palindromic_substring(s):',
-        'tests': [
-            {'args': ("babad",), 'expected': "bab"},
-            {'args': ("cbbd",), 'expected': "bb"},
-        ]
-    },
-    'rotate_matrix': {
-        'name': 'rotate_matrix',
-        'title': 'Rotate Matrix 90°',
-        'description': 'Implement rotate_matrix(matrix) to return a new matrix rotated 90 degrees clockwise.',
-        'signature': 'def rotate_matrix(matrix):',
-        'tests': [
-            {'args': ([[1,2,3],[4,5,6],[7,8,9]],), 'expected': [[7,4,1],[8,5,2],[9,6,3]]},
-        ]
-    },
-    'number_of_islands': {
-        'name': 'number_of_islands',
-        'title': 'Number of Islands',
-        'description': 'Implement number_of_islands(grid) where grid is a list of list of "1" and "0"; return count of islands (4-direction).',
-        'signature': 'def number_of_islands(grid):',
-        'tests': [
-            {'args': (([["1","1","0","0","0"],["1","1","0","0","0"],["0","0","1","0","0"],["0","0","0","1","1"]]),), 'expected': 3},
-        ]
-    },
-}
+# Suites are split across pooled workers only when each chunk gets at least this
+# many tests, and only for languages without a compile step (every chunk is a
+# separate program, so C++/Java would compile once per chunk).
+PARALLEL_MIN_TESTS = 8
+PARALLEL_LANGUAGES = ('python', 'javascript')
 
-# Optional per-problem hints shown in the UI
-HINTS = {
-    'summation': {
-        'python': {
-            'bullets': [
-                'Step 1: This is a simple function that returns the sum of two integers.',
-                'Step 2: In Python, the + operator works directly on integers with no overflow concerns.',
-                'Step 3: Python integers have arbitrary precision - they can grow as large as memory allows.',
-                'Step 4: Simply return a + b. No need for type checking or edge cases.',
-                'Example: summation(5, 3) → 8, summation(-10, 20) → 10',
-            ],
-            'pseudocode': 'def summation(a, b):\\n    # Return the sum of two integers\\n    return a + b\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Be careful with implicit type coercion; ensure inputs are numbers.',
-                'Return a + b; Node.js will handle number addition.',
-            ],
-            'pseudocode': 'function summation(a, b) {\\n    return a + b;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Use primitive ints to avoid boxing overhead.',
-                'Return a + b from the method.',
-            ],
-            'pseudocode': 'public int summation(int a, int b) {\\n    return a + b;\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Use int (or long) depending on expected range.',
-                'Return a + b from the function.',
-            ],
-            'pseudocode': 'int summation(int a, int b) {\\n    return a + b;\\n}\\n'
-        },
-    },
-    'palindrome': {
-        'python': {
-            'bullets': [
-                'Step 1: A palindrome reads the same forward and backward (e.g., "racecar", "A man a plan a canal Panama").',
-                'Step 2: First, filter the string to keep only alphanumeric characters (letters and numbers).',
-                'Step 3: Use str.isalnum() to check if a character is alphanumeric, and convert to lowercase with .lower().',
-                'Step 4: Build a filtered list using list comprehension: [c.lower() for c in s if c.isalnum()].',
-                'Step 5: Use two pointers: i starts at 0 (beginning), j starts at len(t)-1 (end).',
-                'Step 6: Compare characters at i and j. If they don\'t match, it\'s not a palindrome - return False.',
-                'Step 7: Move pointers inward: i += 1, j -= 1. Continue until pointers meet.',
-                'Step 8: If all comparisons match, return True. Empty string is considered a palindrome.',
-                'Example: "A man, a plan, a canal: Panama" → filtered:"amanaplanacanalpanama" → palindrome!',
-            ],
-            'pseudocode': 'def is_palindrome(s):\\n    # Step 1: Filter to alphanumeric and lowercase\\n    t = [c.lower() for c in s if c.isalnum()]\\n    \\n    # Step 2: Two pointers from both ends\\n    i, j = 0, len(t)-1\\n    \\n    # Step 3: Compare characters while moving inward\\n    while i < j:\\n        if t[i] != t[j]:\\n            return False  # Mismatch found\\n        i += 1\\n        j -= 1\\n    \\n    # Step 4: All characters matched\\n    return True\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Normalize with regex: keep alphanumeric and toLowerCase().',
-                'Use two indices or reverse the string and compare.',
-            ],
-            'pseudocode': 'function is_palindrome(s) {\\n    const t = s.replace(/[^a-z0-9]/gi, "").toLowerCase();\\n    return t === t.split("").reverse().join("");\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Use Character.isLetterOrDigit and Character.toLowerCase for normalization.',
-                'Use two-pointer approach on a char array.',
-            ],
-            'pseudocode': 'public boolean is_palindrome(String s) {\\n    StringBuilder sb = new StringBuilder();\\n    for (char c: s.toCharArray()) if (Character.isLetterOrDigit(c)) sb.append(Character.toLowerCase(c));\\n    String t = sb.toString(); return new StringBuilder(t).reverse().toString().equals(t);\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Use isalnum from <cctype> and tolower for normalization.',
-                'Build a filtered string and compare with reverse.',
-            ],
-            'pseudocode': 'bool is_palindrome(string s) {\\n    string t; for (char c: s) if (isalnum((unsigned char)c)) t.push_back(tolower((unsigned char)c)); return equal(t.begin(), t.begin()+t.size()/2, t.rbegin());\\n}\\n'
-        },
-    },
-    'second_largest': {
-        'python': {
-            'bullets': [
-                'Step 1: Find the second largest DISTINCT value in an array. Duplicates don\'t count.',
-                'Step 2: Track two variables: top1 (largest) and top2 (second largest). Initialize both to None.',
-                'Step 3: For each element x in the array, check if it\'s larger than top1.',
-                'Step 4: If x > top1 (or top1 is None), update top2 to the old top1 value, then update top1 to x.',
-                'Step 5: IMPORTANT: Only update top2 if x is different from top1 (skip duplicates).',
-                'Step 6: Else if x < top1 but x > top2 (and x != top1), update top2 to x.',
-                'Step 7: After processing all elements, return top2.',
-                'Step 8: Edge case: If array has fewer than 2 distinct values, top2 will be None.',
-                'Example: [5,3,5,9,3,7] → top1=9, top2=7 (skipped duplicate 5s and 3s)',
-            ],
-            'pseudocode': 'def second_largest(nums):\\n    # Step 1: Initialize tracking variables\\n    top1 = top2 = None\\n    \\n    # Step 2: Process each number\\n    for x in nums:\\n        # Step 3: Check if new largest\\n        if top1 is None or x > top1:\\n            # Update top2 only if x is distinct\\n            if x != top1:\\n                top2 = top1\\n            top1 = x\\n        # Step 4: Check if new second largest\\n        elif x != top1 and (top2 is None or x > top2):\\n            top2 = x\\n    \\n    return top2\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Track top1 and top2 distinct values in one pass.',
-                'Update top2 when you update top1; skip duplicates.',
-            ],
-            'pseudocode': 'function secondLargest(nums) {\\n    let top1 = null, top2 = null;\\n    for (const x of nums) {\\n        if (top1 === null || x > top1) { if (x !== top1) top2 = top1; top1 = x; }\\n        else if (x !== top1 && (top2 === null || x > top2)) top2 = x;\\n    }\\n    return top2;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Track top1 and top2 distinct values in one pass.',
-                'Update top2 when you update top1; skip duplicates.',
-            ],
-            'pseudocode': 'Integer secondLargest(int[] nums) {\\n    Integer top1 = null, top2 = null;\\n    for (int x : nums) {\\n        if (top1 == null || x > top1) { if (x != top1) top2 = top1; top1 = x; }\\n        else if (x != top1 && (top2 == null || x > top2)) top2 = x;\\n    }\\n    return top2;\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Track top1 and top2 distinct values in one pass.',
-                'Update top2 when you update top1; skip duplicates.',
-            ],
-            'pseudocode': 'int secondLargest(vector<int>& nums) {\\n    int top1 = INT_MIN, top2 = INT_MIN;\\n    bool has1 = false, has2 = false;\\n    for (int x : nums) {\\n        if (!has1 || x > top1) { if (has1 && x != top1) { top2 = top1; has2 = true; } top1 = x; has1 = true; }\\n        else if (x != top1 && (!has2 || x > top2)) { top2 = x; has2 = true; }\\n    }\\n    return has2 ? top2 : INT_MIN;\\n}\\n'
-        },
-    },
-    'frequency_sort': {
-        'python': {
-            'bullets': [
-                'Step 1: Import Counter from collections module - a dictionary subclass for counting hashable objects.',
-                'Step 2: Use Counter(s) to count frequency of each character. Returns a dict where keys are characters and values are their counts.',
-                'Step 3: Sort using sorted() with a custom key. The lambda function returns a tuple: (-frequency, character).',
-                'Step 4: Negative frequency ensures descending order (most frequent first). Character ensures lexicographical order for ties.',
-                'Step 5: Use list comprehension to repeat each character by its frequency: ch*freq.',
-                'Step 6: Join all repeated characters into a single string with "".join().',
-                'Example: "tree" → Counter: {"t":1,"r":1,"e":2} → sorted: [("e",2),("r",1),("t",1)] → "eerт" or "eert"',
-            ],
-            'pseudocode': 'from collections import Counter\\n\\ndef frequency_sort(s):\\n    # Step 1: Count character frequencies\\n    counts = Counter(s)\\n    \\n    # Step 2: Sort by frequency (desc), then lexicographically (asc)\\n    parts = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))\\n    \\n    # Step 3: Repeat each character by its frequency and join\\n    return "".join(ch*freq for ch,freq in parts)\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Count with a Map/object.',
-                'Sort by (-freq, char).',
-            ],
-            'pseudocode': 'function frequencySort(s) {\\n    const counts = new Map();\\n    for (const c of s) counts.set(c, (counts.get(c) || 0) + 1);\\n    const parts = [...counts.entries()].sort((a,b) => b[1]-a[1] || a[0].localeCompare(b[0]));\\n    return parts.map(([ch, f]) => ch.repeat(f)).join("");\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Count with HashMap and sort entries.',
-                'Sort by freq desc then char asc.',
-            ],
-            'pseudocode': 'String frequencySort(String s) {\\n    Map<Character, Integer> cnt = new HashMap<>();\\n    for (char c : s.toCharArray()) cnt.put(c, cnt.getOrDefault(c, 0) + 1);\\n    // Sort and build result\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Count with unordered_map and sort vector of pairs.',
-                'Sort by freq desc then char asc.',
-            ],
-            'pseudocode': 'string frequencySort(string s) {\\n    unordered_map<char, int> cnt;\\n    for (char c : s) cnt[c]++;\\n    vector<pair<char, int>> v(cnt.begin(), cnt.end());\\n    sort(v.begin(), v.end(), [](auto &a, auto &b) {\\n        return a.second != b.second ? a.second > b.second : a.first < b.first;\\n    });\\n    string out;\\n    for (auto &p : v) out += string(p.second, p.first);\\n    return out;\\n}\\n'
-        },
-    },
-    'merge_intervals': {
-        'python': {
-            'bullets': [
-                'Step 1: An interval is [start, end]. Overlapping intervals should be merged into one.',
-                'Step 2: First, sort all intervals by their start time. This groups overlapping intervals together.',
-                'Step 3: Use key=lambda x: x[0] to sort by the first element (start time).',
-                'Step 4: Initialize an empty result list to store merged intervals.',
-                'Step 5: For each interval [s, e], check if it overlaps with the last interval in result.',
-                'Step 6: Intervals overlap if current start <= last end. Example: [1,3] and [2,6] overlap.',
-                'Step 7: If NO overlap (s > res[-1][1]), append the interval as a new entry.',
-                'Step 8: If overlap, merge by updating the end: res[-1][1] = max(res[-1][1], e).',
-                'Step 9: Time: O(n log n) for sorting + O(n) for merging = O(n log n).',
-                'Example: [[1,3],[2,6],[8,10],[15,18]] → sorted → merge [1,3] & [2,6] → [[1,6],[8,10],[15,18]]',
-            ],
-            'pseudocode': 'def merge_intervals(intervals):\\n    # Step 1: Sort by start time\\n    intervals.sort(key=lambda x: x[0])\\n    \\n    # Step 2: Initialize result list\\n    res = []\\n    \\n    # Step 3: Process each interval\\n    for s, e in intervals:\\n        # Step 4: Check if overlaps with last interval\\n        if not res or s > res[-1][1]:\\n            # No overlap - add as new interval\\n            res.append([s, e])\\n        else:\\n            # Overlap - merge by extending end\\n            res[-1][1] = max(res[-1][1], e)\\n    \\n    return res\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Sort and merge intervals similarly.',
-            ],
-            'pseudocode': 'function mergeIntervals(intervals) {\\n    intervals.sort((a, b) => a[0] - b[0]);\\n    const res = [];\\n    for (const [s, e] of intervals) {\\n        if (!res.length || s > res[res.length-1][1]) res.push([s, e]);\\n        else res[res.length-1][1] = Math.max(res[res.length-1][1], e);\\n    }\\n    return res;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Sort intervals and merge in one pass.',
-            ],
-            'pseudocode': 'int[][] mergeIntervals(int[][] intervals) {\\n    Arrays.sort(intervals, (a, b) -> a[0] - b[0]);\\n    List<int[]> res = new ArrayList<>();\\n    for (int[] it : intervals) {\\n        if (res.isEmpty() || it[0] > res.get(res.size()-1)[1]) res.add(it);\\n        else res.get(res.size()-1)[1] = Math.max(res.get(res.size()-1)[1], it[1]);\\n    }\\n    return res.toArray(new int[res.size()][]);\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Sort and merge intervals.',
-            ],
-            'pseudocode': 'vector<vector<int>> mergeIntervals(vector<vector<int>>& intervals) {\\n    sort(intervals.begin(), intervals.end());\\n    vector<vector<int>> res;\\n    for (auto &v : intervals) {\\n        if (res.empty() || v[0] > res.back()[1]) res.push_back(v);\\n        else res.back()[1] = max(res.back()[1], v[1]);\\n    }\\n    return res;\\n}\\n'
-        },
-    },
-    'two_sum': {
-        'python': {
-            'bullets': [
-                'Step 1: Create an empty dictionary called "seen" to store value→index mappings.',
-                'Step 2: Iterate through the array with enumerate() to get both index and value.',
-                'Step 3: For each element x, calculate the complement y = target - x.',
-                'Step 4: Check if complement y exists in the "seen" dictionary. If yes, we found our pair!',
-                'Step 5: Return [seen[y], i] - the index of the complement and current index.',
-                'Step 6: If not found, add current value to "seen": seen[x] = i.',
-                'Step 7: We check BEFORE inserting to avoid using the same element twice.',
-                'Example: nums=[2,7,11,15], target=9 → i=0:seen={}, y=7, add 2→0 → i=1:y=2, found! return [0,1]',
-            ],
-            'pseudocode': 'def two_sum(nums, target):\\n    # Step 1: Create hashmap to store value→index\\n    seen = {}\\n    \\n    # Step 2: Iterate with index and value\\n    for i, x in enumerate(nums):\\n        # Step 3: Calculate complement\\n        y = target - x\\n        \\n        # Step 4: Check if complement exists\\n        if y in seen:\\n            return [seen[y], i]\\n        \\n        # Step 5: Store current value and index\\n        seen[x] = i\\n    \\n    return [-1, -1]  # No solution found\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Use a Map to store seen values to indices.',
-                'Be mindful of === vs == when comparing.',
-            ],
-            'pseudocode': 'function two_sum(nums, target) {\\n    const seen = new Map();\\n    for (let i = 0; i < nums.length; i++) {\\n        const y = target - nums[i];\\n        if (seen.has(y)) return [seen.get(y), i];\\n        seen.set(nums[i], i);\\n    }\\n    return [-1, -1];\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Use HashMap<Integer,Integer> to map value→index.',
-                'Beware of integer boxing/unboxing; use primitives where convenient.',
-            ],
-            'pseudocode': 'public int[] two_sum(int[] nums, int target) {\\n    Map<Integer,Integer> seen = new HashMap<>();\\n    for (int i=0;i<nums.length;i++) {\\n        int y = target - nums[i];\\n        if (seen.containsKey(y)) return new int[]{seen.get(y), i};\\n        seen.put(nums[i], i);\\n    }\\n    return new int[]{-1,-1};\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Use unordered_map<int,int> for O(1) lookups.',
-                'Return vector<int>{idx1, idx2} or {-1,-1} if not found.',
-            ],
-            'pseudocode': 'vector<int> two_sum(vector<int>& nums, int target) {\\n    unordered_map<int,int> seen;\\n    for (int i=0;i<nums.size();++i) {\\n        int y = target - nums[i];\\n        if (seen.count(y)) return {seen[y], i};\\n        seen[nums[i]] = i;\\n    }\\n    return {-1,-1};\\n}\\n'
-        },
-    },
-    'balanced_brackets': {
-        'python': {
-            'bullets': [
-                'Step 1: Create a dictionary mapping each closing bracket to its corresponding opening bracket.',
-                'Step 2: Initialize an empty list to use as a stack. Stack follows LIFO (Last In First Out).',
-                'Step 3: Iterate through each character in the string.',
-                'Step 4: If the character is an opening bracket "([{", push it onto the stack.',
-                'Step 5: If it\'s a closing bracket ")]}", check if stack is empty or top doesn\'t match - return False.',
-                'Step 6: If it matches, pop the opening bracket from the stack.',
-                'Step 7: After processing all characters, return True if stack is empty (all brackets matched).',
-                'Example: "({[]})" → push(, push{, push[, pop[ matches ], pop{ matches }, pop( matches ) → stack empty → valid!',
-            ],
-            'pseudocode': 'def is_valid(s):\\n    # Step 1: Map closing brackets to opening brackets\\n    pairs = {")": "(", "]": "[", "}": "{"}\\n    \\n    # Step 2: Initialize stack\\n    stack = []\\n    \\n    # Step 3: Process each character\\n    for c in s:\\n        # Step 4: If opening bracket, push to stack\\n        if c in "([{":\\n            stack.append(c)\\n        # Step 5: If closing bracket, validate\\n        elif c in ")]}":\\n            if not stack or stack[-1] != pairs[c]:\\n                return False\\n            # Step 6: Pop matching opening bracket\\n            stack.pop()\\n    \\n    # Step 7: Valid if all brackets matched (stack empty)\\n    return not stack\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Use an array as a stack, map closing to opening char.',
-            ],
-            'pseudocode': 'function isValid(s) {\\n    const pairs = {")":"(", "]":"[", "}":"{"};\\n    const st = [];\\n    for (const c of s) {\\n        if ("([{".includes(c)) st.push(c);\\n        else if (st.length === 0 || st.pop() !== pairs[c]) return false;\\n    }\\n    return st.length === 0;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Use Deque/Stack to track opens.',
-            ],
-            'pseudocode': 'boolean isValid(String s) {\\n    Map<Character,Character> pairs = Map.of(\\n        \\\')\\\', \\\'(\\\', \\\']\\\', \\\'[\\\', \\\'}\\\', \\\'{\\\');\\n    Deque<Character> st = new ArrayDeque<>();\\n    for (char c : s.toCharArray()) {\\n        if (pairs.containsValue(c)) st.push(c);\\n        else if (st.isEmpty() || st.pop() != pairs.get(c)) return false;\\n    }\\n    return st.isEmpty();\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Use vector<char> as stack and mapping for closes.',
-            ],
-            'pseudocode': 'bool isValid(string s) {\\n    unordered_map<char,char> pairs = {{\\\')\\\',\\\'(\\\'},{\\\']\\\',\\\'[\\\'},{\\\'}\\\',\\\'{\\\'}}; \\n    vector<char> st;\\n    for (char c : s) {\\n        if (c==\\\'(\\\'||c==\\\'[\\\'||c==\\\'{\\\') st.push_back(c);\\n        else if (st.empty() || st.back()!=pairs[c]) return false; else st.pop_back();\\n    }\\n    return st.empty();\\n}\\n'
-        },
-    },
-    'max_subarray': {
-        'python': {
-            'bullets': [
-                'Step 1: This is Kadane\'s Algorithm - a classic dynamic programming approach for maximum subarray sum.',
-                'Step 2: Initialize both "best" and "current" to the first element of the array.',
-                'Step 3: "current" represents the maximum sum ending at the current position.',
-                'Step 4: "best" represents the maximum sum found so far across all positions.',
-                'Step 5: For each element x (starting from index 1), decide: start fresh with x, or extend previous subarray with cur+x.',
-                'Step 6: Update current = max(x, current + x). If cur+x is negative, it\'s better to start fresh.',
-                'Step 7: Update best = max(best, current) to track the overall maximum.',
-                'Step 8: Why it works: negative prefixes only hurt future sums, so we discard them.',
-                'Example: [-2,1,-3,4,-1,2,1,-5,4] → cur at index 3 becomes 4 (start fresh), then 3,5,6... best=6',
-            ],
-            'pseudocode': 'def max_subarray(nums):\\n    # Step 1: Initialize with first element\\n    best = current = nums[0]\\n    \\n    # Step 2: Process remaining elements\\n    for x in nums[1:]:\\n        # Step 3: Decide to extend or start fresh\\n        current = max(x, current + x)\\n        \\n        # Step 4: Update global maximum\\n        best = max(best, current)\\n    \\n    return best\\n'
-        },
-        'javascript': {
-            'bullets': [
-                "Kadane's algorithm",
-            ],
-            'pseudocode': 'function maxSubarray(nums) {\\n    let best = nums[0], cur = nums[0];\\n    for (let i = 1; i < nums.length; i++) {\\n        cur = Math.max(nums[i], cur + nums[i]);\\n        best = Math.max(best, cur);\\n    }\\n    return best;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                "Kadane's algorithm",
-            ],
-            'pseudocode': 'int maxSubarray(int[] nums) {\\n    int best = nums[0], cur = nums[0];\\n    for (int i = 1; i < nums.length; i++) {\\n        cur = Math.max(nums[i], cur + nums[i]);\\n        best = Math.max(best, cur);\\n    }\\n    return best;\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                "Kadane's algorithm",
-            ],
-            'pseudocode': 'int maxSubarray(vector<int>& nums) {\\n    int best = nums[0], cur = nums[0];\\n    for (size_t i = 1; i < nums.size(); ++i) {\\n        cur = max(nums[i], cur + nums[i]);\\n        best = max(best, cur);\\n    }\\n    return best;\\n}\\n'
-        },
-    },
-    'product_except_self': {
-        'python': {
-            'bullets': [
-                'Step 1: The goal is to compute products of all elements except self WITHOUT using division.',
-                'Step 2: Key insight: result[i] = (product of all elements before i) × (product of all elements after i).',
-                'Step 3: Initialize result array with all 1s of length n.',
-                'Step 4: FIRST PASS (left to right): Build prefix products. For each position i, store product of all elements to the left.',
-                'Step 5: Use variable "pre" to track running product. Start pre=1, then res[i]=pre, then pre*=nums[i].',
-                'Step 6: SECOND PASS (right to left): Multiply by suffix products. For each position i, multiply by product of all elements to the right.',
-                'Step 7: Use variable "suf" to track running product from right. Start suf=1, then res[i]*=suf, then suf*=nums[i].',
-                'Step 8: Time: O(n), Space: O(1) extra (output doesn\'t count).',
-                'Example: [1,2,3,4] → prefix:[1,1,2,6] → suffix:[24,12,4,1] → result:[24,12,8,6]',
-            ],
-            'pseudocode': 'def product_except_self(nums):\\n    n = len(nums)\\n    res = [1] * n\\n    \\n    # First pass: prefix products\\n    pre = 1\\n    for i in range(n):\\n        res[i] = pre  # Product of all elements before i\\n        pre *= nums[i]\\n    \\n    # Second pass: suffix products\\n    suf = 1\\n    for i in range(n-1, -1, -1):\\n        res[i] *= suf  # Multiply by product of all elements after i\\n        suf *= nums[i]\\n    \\n    return res\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Compute prefix and suffix products.',
-            ],
-            'pseudocode': 'function productExceptSelf(nums) {\\n    const n = nums.length, res = Array(n).fill(1);\\n    let pre = 1;\\n    for (let i = 0; i < n; i++) { res[i] = pre; pre *= nums[i]; }\\n    let suf = 1;\\n    for (let i = n-1; i >= 0; i--) { res[i] *= suf; suf *= nums[i]; }\\n    return res;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Compute prefix and suffix without division.',
-            ],
-            'pseudocode': 'int[] productExceptSelf(int[] nums) {\\n    int n = nums.length, res[] = new int[n];\\n    Arrays.fill(res, 1);\\n    int pre = 1;\\n    for (int i = 0; i < n; i++) { res[i] = pre; pre *= nums[i]; }\\n    int suf = 1;\\n    for (int i = n-1; i >= 0; i--) { res[i] *= suf; suf *= nums[i]; }\\n    return res;\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Compute prefix and suffix.',
-            ],
-            'pseudocode': 'vector<int> productExceptSelf(vector<int>& nums) {\\n    int n = nums.size();\\n    vector<int> res(n, 1);\\n    int pre = 1;\\n    for (int i = 0; i < n; i++) { res[i] = pre; pre *= nums[i]; }\\n    int suf = 1;\\n    for (int i = n-1; i >= 0; i--) { res[i] *= suf; suf *= nums[i]; }\\n    return res;\\n}\\n'
-        },
-    },
-    'three_sum': {
-        'python': {
-            'bullets': [
-                'Step 1: Sort the array first. This allows us to use two-pointer technique and easily skip duplicates.',
-                'Step 2: Fix the first element at index i, then find two other elements that sum to -nums[i].',
-                'Step 3: Use two pointers: left = i+1 (start) and right = len-1 (end).',
-                'Step 4: Calculate sum = nums[i] + nums[left] + nums[right].',
-                'Step 5: If sum == 0, we found a triplet! Add it to results and move both pointers.',
-                'Step 6: If sum < 0, we need a larger sum, so move left pointer right (increase value).',
-                'Step 7: If sum > 0, we need a smaller sum, so move right pointer left (decrease value).',
-                'Step 8: CRITICAL: Skip duplicates! Skip same value at i, and after finding a triplet, skip duplicate left/right values.',
-                'Step 9: Time: O(n²) because we have outer loop O(n) and inner two-pointer O(n).',
-                'Example: [-1,0,1,2,-1,-4] → sorted:[-4,-1,-1,0,1,2] → triplets:[[-1,-1,2],[-1,0,1]]',
-            ],
-            'pseudocode': 'def three_sum(nums):\\n    # Step 1: Sort the array\\n    nums.sort()\\n    res = []\\n    \\n    # Step 2: Fix first element\\n    for i, x in enumerate(nums):\\n        # Skip duplicates for first element\\n        if i > 0 and nums[i] == nums[i-1]:\\n            continue\\n        \\n        # Step 3: Two pointers for remaining elements\\n        l, r = i+1, len(nums)-1\\n        \\n        while l < r:\\n            s = x + nums[l] + nums[r]\\n            \\n            if s == 0:\\n                # Found triplet!\\n                res.append([x, nums[l], nums[r]])\\n                l += 1\\n                r -= 1\\n                # Skip duplicate left values\\n                while l < r and nums[l] == nums[l-1]:\\n                    l += 1\\n                # Skip duplicate right values\\n                while l < r and nums[r] == nums[r+1]:\\n                    r -= 1\\n            elif s < 0:\\n                l += 1  # Need larger sum\\n            else:\\n                r -= 1  # Need smaller sum\\n    \\n    return res\\n'
-        },
-        'javascript': {
-            'bullets': [
-                'Sort and use two-pointer technique.',
-            ],
-            'pseudocode': 'function threeSum(nums) {\\n    nums.sort((a, b) => a - b);\\n    const res = [];\\n    for (let i = 0; i < nums.length; i++) {\\n        if (i && nums[i] == nums[i-1]) continue;\\n        let l = i+1, r = nums.length-1;\\n        while (l < r) {\\n            const s = nums[i] + nums[l] + nums[r];\\n            if (s == 0) {\\n                res.push([nums[i], nums[l], nums[r]]);\\n                l++; r--;\\n                while (l < r && nums[l] == nums[l-1]) l++;\\n                while (l < r && nums[r] == nums[r+1]) r--;\\n            } else if (s < 0) l++;\\n            else r--;\\n        }\\n    }\\n    return res;\\n}\\n'
-        },
-        'java': {
-            'bullets': [
-                'Sort and two-pointer approach.',
-            ],
-            'pseudocode': 'List<List<Integer>> threeSum(int[] nums) {\\n    Arrays.sort(nums);\\n    List<List<Integer>> res = new ArrayList<>();\\n    for (int i = 0; i < nums.length; i++) {\\n        if (i > 0 && nums[i] == nums[i-1]) continue;\\n        int l = i+1, r = nums.length-1;\\n        while (l < r) {\\n            int s = nums[i] + nums[l] + nums[r];\\n            if (s == 0) {\\n                res.add(Arrays.asList(nums[i], nums[l], nums[r]));\\n                l++; r--;\\n                while (l < r && nums[l] == nums[l-1]) l++;\\n                while (l < r && nums[r] == nums[r+1]) r--;\\n            } else if (s < 0) l++;\\n            else r--;\\n        }\\n    }\\n    return res;\\n}\\n'
-        },
-        'cpp': {
-            'bullets': [
-                'Sort and two-pointer approach.',
-            ],
-            'pseudocode': 'vector<vector<int>> threeSum(vector<int>& nums) {\\n    sort(nums.begin(), nums.end());\\n    vector<vector<int>> res;\\n    for (int i = 0; i < nums.size(); ++i) {\\n        if (i && nums[i] == nums[i-1]) continue;\\n        int l = i+1, r = nums.size()-1;\\n        while (l < r) {\\n            int s = nums[i] + nums[l] + nums[r];\\n            if (s == 0) {\\n                res.push_back({nums[i], nums[l], nums[r]});\\n                l++; r--;\\n                while (l < r && nums[l] == nums[l-1]) l++;\\n                while (l < r && nums[r] == nums[r+1]) r--;\\n            } else if (s < 0) l++;\\n            else r--;\\n        }\\n    }\\n    return res;\\n}\\n'
-        },
-    },
-    'two_sum_sorted': {
-        'bullets': [
-            'Step 1: This is Two Sum II - the array is ALREADY SORTED, so we can use two pointers (no hashmap needed!).',
-            'Step 2: Initialize left pointer at 0 (smallest element) and right pointer at len(nums)-1 (largest element).',
-            'Step 3: Calculate sum = nums[left] + nums[right].',
-            'Step 4: If sum == target, we found the pair! Return [left, right].',
-            'Step 5: If sum < target, we need a larger sum. Move left pointer right (left += 1) to get a bigger number.',
-            'Step 6: If sum > target, we need a smaller sum. Move right pointer left (right -= 1) to get a smaller number.',
-            'Step 7: Continue until left >= right. If no pair found, return [-1, -1].',
-            'Step 8: Time: O(n) because each pointer moves at most n times. Space: O(1) - just two pointers!',
-            'Example: [2,7,11,15], target=9 → l=0,r=3: sum=17>9 → r=2: sum=13>9 → r=1: sum=9! → [0,1]',
-        ],
-        'pseudocode': 'def two_sum_sorted(nums, target):\\n    # Step 1: Initialize two pointers\\n    left, right = 0, len(nums) - 1\\n    \\n    # Step 2: Search while pointers haven\'t crossed\\n    while left < right:\\n        # Step 3: Calculate current sum\\n        s = nums[left] + nums[right]\\n        \\n        # Step 4: Check if found\\n        if s == target:\\n            return [left, right]\\n        \\n        # Step 5: Adjust pointers based on sum\\n        if s < target:\\n            left += 1  # Need larger sum\\n        else:\\n            right -= 1  # Need smaller sum\\n    \\n    # Step 6: No pair found\\n    return [-1, -1]\\n'
-    },
-    'longest_substring_without_repeating_characters': {
-        'bullets': [
-            'Step 1: Find the longest substring with all unique characters (no repeats). Example: "abcabcbb" → "abc" length 3.',
-            'Step 2: Use sliding window technique with a hashmap to track the last seen position of each character.',
-            'Step 3: Initialize: last={} (empty dict), left=0 (window start), best=0 (max length found).',
-            'Step 4: Iterate through string with enumerate() to get both index i and character c.',
-            'Step 5: If character c was seen before AND is in current window, move left pointer to exclude the duplicate.',
-            'Step 6: Update left = max(left, last[c]+1). The max ensures left never moves backward.',
-            'Step 7: Update last[c] = i to record the current position of character c.',
-            'Step 8: Calculate current window length: i - left + 1. Update best = max(best, current length).',
-            'Step 9: Time: O(n) single pass. Space: O(min(n, charset)) for the hashmap.',
-            'Example: "abcabcbb" → i=3,c=\'a\': left=1 → i=4,c=\'b\': left=2 → i=5,c=\'c\': left=3 → best=3',
-        ],
-        'pseudocode': 'def longest_substring_without_repeating_characters(s):\\n    # Step 1: Initialize tracking variables\\n    last = {}  # Character to last seen index\\n    left = 0   # Window start\\n    best = 0   # Maximum length\\n    \\n    # Step 2: Process each character\\n    for i, c in enumerate(s):\\n        # Step 3: If duplicate found in window, shrink from left\\n        if c in last:\\n            left = max(left, last[c] + 1)\\n        \\n        # Step 4: Update last seen position\\n        last[c] = i\\n        \\n        # Step 5: Update maximum length\\n        best = max(best, i - left + 1)\\n    \\n    return best\\n'
-    },
-    'group_anagrams': {
-        'bullets': [
-            'Step 1: Anagrams are words with the same letters rearranged (e.g., "eat", "tea", "ate").',
-            'Step 2: Key insight: Anagrams will have the same sorted letters. "eat"→"aet", "tea"→"aet", "ate"→"aet".',
-            'Step 3: Use a dictionary (hashmap) to group words. The key is the sorted version of the word.',
-            'Step 4: Import defaultdict(list) from collections to automatically create empty lists for new keys.',
-            'Step 5: For each word, sort its characters with sorted(w), then join with "".join() to create the key.',
-            'Step 6: Append the original word to the list at mp[key]. All anagrams will map to the same key.',
-            'Step 7: Extract all the groups with mp.values(). Each group is a list of anagrams.',
-            'Step 8: For deterministic output, sort each group internally and sort the groups themselves.',
-            'Step 9: Time: O(n*k*log k) where n=number of words, k=max word length (for sorting each word).',
-            'Example: ["eat","tea","tan","ate","nat","bat"] → groups: [["ate","eat","tea"], ["nat","tan"], ["bat"]]',
-        ],
-        'pseudocode': 'from collections import defaultdict\\n\\ndef group_anagrams(strs):\\n    # Step 1: Create hashmap with lists as default values\\n    mp = defaultdict(list)\\n    \\n    # Step 2: Process each word\\n    for w in strs:\\n        # Step 3: Create key by sorting characters\\n        key = "".join(sorted(w))\\n        \\n        # Step 4: Add word to its anagram group\\n        mp[key].append(w)\\n    \\n    # Step 5: Sort groups for deterministic output\\n    return [sorted(v) for v in sorted(mp.values(), key=lambda x: (len(x), x))]\\n'
-    },
-    'top_k_frequent': {
-        'bullets': [
-            'Step 1: Find the k most frequent elements in an array. If frequencies tie, sort lexicographically.',
-            'Step 2: Import Counter from collections module - it counts element frequencies automatically.',
-            'Step 3: Use Counter(nums) to get a dictionary of element→frequency mappings.',
-            'Step 4: Convert to list of (element, frequency) tuples with counts.items().',
-            'Step 5: Sort using a lambda function with tuple key: (-frequency, element).',
-            'Step 6: Negative frequency ensures descending order (highest frequency first).',
-            'Step 7: Element in tuple ensures lexicographical order for ties (ascending).',
-            'Step 8: Use list comprehension to extract just the elements: [x for x,_ in items[:k]].',
-            'Step 9: Time: O(n log n) for sorting. Could use heap for O(n log k) but sorting is simpler.',
-            'Example: [1,1,1,2,2,3], k=2 → Counter:{1:3,2:2,3:1} → sorted:[(1,3),(2,2)] → [1,2]',
-        ],
-        'pseudocode': 'from collections import Counter\\n\\ndef top_k_frequent(nums, k):\\n    # Step 1: Count frequencies\\n    counts = Counter(nums)\\n    \\n    # Step 2: Sort by frequency (desc), then value (asc)\\n    items = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))\\n    \\n    # Step 3: Extract top k elements\\n    return [x for x, _ in items[:k]]\\n'
-    },
-    'kth_largest': {
-        'bullets': ['Quickselect or heap; quickselect is average O(n).'],
-        'pseudocode': '# quickselect partition around pivot to find index n-k\n'
-    },
-    'binary_search': {
-        'bullets': [
-            'Step 1: Binary search works ONLY on sorted arrays. It finds a target in O(log n) time by halving the search space.',
-            'Step 2: Initialize two pointers: left=0 (start) and right=len(nums)-1 (end).',
-            'Step 3: While left <= right (search space not empty), calculate middle index: mid = (left+right)//2.',
-            'Step 4: Check nums[mid]. If it equals target, we found it! Return mid.',
-            'Step 5: If nums[mid] < target, the target must be in the right half. Update left = mid+1.',
-            'Step 6: If nums[mid] > target, the target must be in the left half. Update right = mid-1.',
-            'Step 7: Repeat until left > right. If we exit the loop, target not found - return -1.',
-            'Step 8: Why it works: Each comparison eliminates half the remaining elements.',
-            'Example: [1,3,5,7,9], target=7 → mid=5(not match), 7>5 so left half → mid=7(match!) → return 3',
-        ],
-        'pseudocode': 'def binary_search(nums, target):\\n    # Step 1: Initialize pointers\\n    left, right = 0, len(nums) - 1\\n    \\n    # Step 2: Search while space exists\\n    while left <= right:\\n        # Step 3: Calculate middle\\n        mid = (left + right) // 2\\n        \\n        # Step 4: Check if found\\n        if nums[mid] == target:\\n            return mid\\n        \\n        # Step 5: Narrow search space\\n        if nums[mid] < target:\\n            left = mid + 1  # Search right half\\n        else:\\n            right = mid - 1  # Search left half\\n    \\n    # Step 6: Not found\\n    return -1\\n'
-    },
-    'search_rotated_sorted_array': {
-        'bullets': ['One half is sorted at each step.', 'Check which half target lies in and adjust.'],
-        'pseudocode': 'l,r=0,len(nums)-1\nwhile l<=r:\n  m=(l+r)//2\n  if nums[m]==target: return m\n  if nums[l]<=nums[m]:\n    if nums[l]<=target<nums[m]: r=m-1\n    else: l=m+1\n  else:\n    if nums[m]<target<=nums[r]: l=m+1\n    else: r=m-1\nreturn -1\n'
-    },
-    'max_product_subarray': {
-        'bullets': ['Track both max and min due to negatives.', 'Swap when x<0.'],
-        'pseudocode': 'best=hi=lo=nums[0]\nfor x in nums[1:]:\n  if x<0: hi,lo=lo,hi\n  hi=max(x, hi*x); lo=min(x, lo*x)\n  best=max(best, hi)\nreturn best\n'
-    },
-    'coin_change': {
-        'bullets': ['Bottom-up DP: dp[a]=min(dp[a], dp[a-c]+1).', 'Initialize dp with inf and dp[0]=0.'],
-        'pseudocode': 'dp=[10**9]*(amount+1); dp[0]=0\nfor c in coins:\n  for a in range(c, amount+1):\n    dp[a]=min(dp[a], dp[a-c]+1)\nreturn dp[amount] if dp[amount]<10**9 else -1\n'
-    },
-    'climb_stairs': {
-        'python': {
-            'bullets': ['Fibonacci: f(n)=f(n-1)+f(n-2).', 'Iterative O(1) space.'],
-            'pseudocode': 'a,b=1,1\\nfor _ in range(n-1): a,b=b,a+b\\nreturn b if n>0 else 1\\n'
-        },
-        'javascript': {
-            'bullets': ['Fibonacci: f(n)=f(n-1)+f(n-2).', 'Iterative O(1) space.'],
-            'pseudocode': 'function climb_stairs(n) {\\n    let a=1,b=1; for (let i=0;i<n-1;i++){ [a,b]=[b,a+b]; } return n>0?b:1; }\\n'
-        },
-        'java': {
-            'bullets': ['Fibonacci relation; iterative approach preferred to recursion.', 'Use int/long depending on n.'],
-            'pseudocode': 'public int climb_stairs(int n) {\\n    int a=1,b=1; for (int i=0;i<n-1;i++){ int t=b; b=a+b; a=t; } return n>0?b:1; }\\n'
-        },
-        'cpp': {
-            'bullets': ['Fibonacci relation; iterative approach preferred to recursion.', 'Use int/long depending on n.'],
-            'pseudocode': 'int climb_stairs(int n) {\\n    int a=1,b=1; for (int i=0;i<n-1;i++){ int t=b; b=a+b; a=t; } return n>0?b:1; }\\n'
-        },
-    },
-    'min_window_substring': {
-        'bullets': ['Sliding window with need/have counts.', 'Expand right until valid, then shrink left.'],
-        'pseudocode': '# Use Counter for t; track formed == required distinct chars.\n'
-    },
-    'longest_palindromic_substring': {
-        'bullets': ['Expand-around-center for each i (odd and even).'],
-        'pseudocode': 'def expand(l,r):\n  while l>=0 and r<len(s) and s[l]==s[r]: l-=1; r+=1\n  return l+1,r-1\n# track best window\n'
-    },
-    'rotate_matrix': {
-        'bullets': ['Transpose then reverse each row (in-place) or build new using zip.'],
-        'pseudocode': 'return [list(row)[::-1] for row in zip(*matrix)]\n'
-    },
-    'number_of_islands': {
-        'python': {
-            'bullets': ['Scan grid; when you see "1", DFS/BFS to mark all connected land to "0".', 'Use bounds checks and 4-direction neighbors.'],
-            'pseudocode': 'def dfs(r,c):\\n  if out_of_bounds or grid[r][c]!="1": return\\n  grid[r][c]="0"\\n  for dr,dc in [(1,0),(-1,0),(0,1),(0,-1)]: dfs(r+dr,c+dc)\\ncount=0\\nfor r in range(R):\\n  for c in range(C):\\n    if grid[r][c]=="1": count+=1; dfs(r,c)\\nreturn count\\n'
-        },
-        'javascript': {
-            'bullets': ['Scan grid; use DFS/BFS to mark visited cells.', 'Be careful with in-place modification vs copying.'],
-            'pseudocode': 'function numIslands(grid) {\\n    const R=grid.length, C=grid[0].length; function dfs(r,c){ if(r<0||c<0||r>=R||c>=C||grid[r][c]==="0") return; grid[r][c]="0"; [[1,0],[-1,0],[0,1],[0,-1]].forEach(([dr,dc])=>dfs(r+dr,c+dc)); } let count=0; for(let r=0;r<R;r++) for(let c=0;c<C;c++) if(grid[r][c]==="1"){count++; dfs(r,c);} return count; }\\n'
-        },
-        'java': {
-            'bullets': ['Scan grid; perform DFS/BFS using recursion or stack.', 'Mark visited cells to avoid recounting.'],
-            'pseudocode': 'public int numIslands(char[][] grid) {\\n    int R=grid.length, C=grid[0].length; for(int r=0;r<R;r++) for(int c=0;c<C;c++) if(grid[r][c]==\'1\'){ dfs(grid,r,c); count++; } return count; }\\n'
-        },
-        'cpp': {
-            'bullets': ['Use DFS/BFS and mark visited cells.', 'Watch recursion depth for large grids; consider iterative stack.'],
-            'pseudocode': 'int numIslands(vector<vector<char>>& grid) {\\n    int R=grid.size(), C=grid[0].size(); function<void(int,int)> dfs = [&](int r,int c){ if(r<0||c<0||r>=R||c>=C||grid[r][c]==\'0\') return; grid[r][c]=\'0\'; dfs(r+1,c); dfs(r-1,c); dfs(r,c+1); dfs(r,c-1); }; int count=0; for(int r=0;r<R;r++) for(int c=0;c<C;c++) if(grid[r][c]==\'1\'){count++; dfs(r,c);} return count; }\\n'
-        },
-    },
+def _run_batch(executor, code: str, tests: list, func_name: str) -> list:
+    with _INFLIGHT:
+        try:
+            return executor(code, tests, func_name)
+        except Exception as e:
+            return [e] * len(tests)
+
+def execute_many(language: str, code: str, tests: list, func_name: str) -> list:
+    """Run every test of a submission, fanning large suites out over pooled workers.
+
+    Returns one outcome per test, in order; batch-level failures become that
+    batch's outcomes instead of being raised.
+    """
+    executor = LANGUAGE_EXECUTORS[language]
+    chunks = 1
+    if language in PARALLEL_LANGUAGES:
+        chunks = max(1, min(WORKERS_PER_LANGUAGE, MAX_INFLIGHT, len(tests) // PARALLEL_MIN_TESTS))
+    if chunks == 1:
+        return _run_batch(executor, code, tests, func_name)
+
+    size = -(-len(tests) // chunks)
+    batches = [tests[i:i + size] for i in range(0, len(tests), size)]
+    futures = [_BATCH_POOL.submit(_run_batch, executor, code, batch, func_name) for batch in batches]
+    outcomes = []
+    for batch, future in zip(batches, futures):
+        try:
+            outcomes.extend(future.result(timeout=BATCH_TIMEOUT))
+        except Exception as e:
+            outcomes.extend([e] * len(batch))
+    return outcomes
+
+
+# Problem catalog (statements, stubs and tests) lives in data/problems.json.
+# JSON has no tuples, so test args are restored to tuples on load.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+def _load_data(path: str):
+    """json.load a data file through a marshal copy in __pycache__, the way .pyc caches modules.
+
+    marshal decodes several times faster than json but isn't stable across
+    interpreter versions, so the copy is tagged with the implementation and
+    stamped with the source's mtime and size; a stale copy is rebuilt.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    tag = sys.implementation.cache_tag
+    cache = tag and os.path.join(os.path.dirname(path), '__pycache__',
+                                 f'{os.path.basename(path)}.{tag}.marshal')
+    if cache:
+        try:
+            with open(cache, 'rb') as f:
+                cached_stamp, data = marshal.load(f)
+            if cached_stamp == stamp:
+                return data
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+    with open(path, 'rb') as f:
+        data = json.load(f)
+    if cache:
+        try:
+            os.makedirs(os.path.dirname(cache), exist_ok=True)
+            partial = f'{cache}.{os.getpid()}.{threading.get_ident()}'
+            with open(partial, 'wb') as f:
+                marshal.dump((stamp, data), f)
+            os.replace(partial, cache)
+        except OSError:
+            pass  # read-only install: keep using the JSON
+    return data
+
+# Per-submission invariants are derived here once: the function a submission
+# must define, the bare args tuples, and the tests as the API displays them.
+def _load_problems() -> MappingProxyType:
+    problems = _load_data(os.path.join(DATA_DIR, 'problems.json'))
+    for name, problem in problems.items():
+        for test in problem['tests']:
+            test['args'] = tuple(test['args'])
+        problem['func_name'] = 'is_palindrome' if name == 'palindrome' else name
+        problem['test_args'] = tuple(test['args'] for test in problem['tests'])
+        problem['tests_display'] = tuple(
+            {'args': str(test['args']), 'expected': str(test['expected'])} for test in problem['tests'])
+    return MappingProxyType({sys.intern(name): problem for name, problem in problems.items()})
+
+def _interned(value):
+    """Intern a request string before it is used to probe the catalog tables.
+
+    Their keys are interned, so a probe with an interned string matches on
+    identity instead of comparing characters; non-strings pass through. Only
+    pass values already checked against PROBLEMS / LANGUAGE_EXECUTORS:
+    interned strings are never freed on Python 3.12+.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+PROBLEMS = _load_problems()
+
+for _problem in PROBLEMS.values():
+    for _test in _problem['tests']:
+        _args = _test['args']
+        _ARG_LITERALS[id(_args)] = (_args, MappingProxyType(
+            {language: convert(_args) for language, convert in _ARG_CONVERTERS.items()}))
+
+# Optional per-problem hints shown in the UI, one file per problem under
+# data/hints/, parsed once when the hint table below is built
+HINTS_DIR = os.path.join(DATA_DIR, 'hints')
+
+def _freeze(obj):
+    """Return a read-only copy: mappings become MappingProxyType, lists tuples, strings interned.
+
+    Interning stores text repeated across languages once; frozen containers
+    have no resize slack and can't be mutated by a request handler.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return sys.intern(obj) if isinstance(obj, str) else obj
+
+@lru_cache(maxsize=None)
+def _problem_hints(problem_name: str) -> Optional[MappingProxyType]:
+    try:
+        return _freeze(_normalize_hints(_load_data(os.path.join(HINTS_DIR, f'{problem_name}.json'))))
+    except FileNotFoundError:
+        return None
+
+# Bullets are held as one newline-joined string per hint (one object instead of
+# a tuple of short strings); hint_bullets() splits them for the API.
+# Pseudocode in older hint files still carries escaped newlines and quotes from
+# when it lived in a Python literal; expand them once here instead of per view.
+def _normalize_hints(obj):
+    if isinstance(obj, dict):
+        return {k: _HINT_FIELDS[k](v) if k in _HINT_FIELDS else _normalize_hints(v)
+                for k, v in obj.items()}
+    return obj
+
+_HINT_FIELDS = {
+    'bullets': '\n'.join,
+    'pseudocode': lambda text: text.replace('\\n', '\n').replace("\\'", "'"),
 }
 
+def hint_bullets(hint) -> list:
+    bullets = hint['bullets']
+    return bullets.split('\n') if bullets else []
+
+_DEFAULT_HINT = _freeze({'bullets': 'No hints available yet.', 'pseudocode': ''})
+
+def _resolve_hints(problem_name: str, language: str) -> MappingProxyType:
+    # Only catalog names reach the filesystem (and the cache)
+    entry = _problem_hints(problem_name) if problem_name in PROBLEMS else None
+    if entry is None:
+        return _DEFAULT_HINT
+    # If it looks like a language-keyed mapping (contains language keys)
+    if language in entry:
+        return entry[language]
+    # Backwards-compatible: if entry has 'bullets' treat it as legacy
+    if 'bullets' in entry or 'pseudocode' in entry:
+        return MappingProxyType({
+            'bullets': entry.get('bullets', _DEFAULT_HINT['bullets']),
+            'pseudocode': entry.get('pseudocode', _DEFAULT_HINT['pseudocode'])
+        })
+    # If there's a 'default' key
+    return entry.get('default', _DEFAULT_HINT)
 
-def get_hints_for(problem_name: str, language: str) -> dict:
+# Flat (problem, language) -> resolved hint table for every catalog problem and
+# supported language, built at import (about a millisecond, and shared by
+# preloaded workers), so a lookup is one dict probe instead of walking
+# problem -> language -> leaf
+_HINTS_BY_KEY = {
+    (problem_name, language): _resolve_hints(problem_name, language)
+    for problem_name in PROBLEMS for language in LANGUAGE_EXECUTORS
+}
+
+def get_hints_for(problem_name: str, language: str) -> MappingProxyType:
     """Return hints for a problem adapted to the requested language.
-    HINTS entries may be either the old flat format ({'bullets':..., 'pseudocode':...})
+    Hint files may be either the old flat format ({'bullets':..., 'pseudocode':...})
     or a per-language mapping (e.g. {'python': {...}, 'java': {...}}).
-    This helper returns a dict with keys 'bullets' and 'pseudocode'.
+    This helper returns a read-only mapping with keys 'bullets' (newline-joined,
+    see hint_bullets) and 'pseudocode'.
     """
-    default = {'bullets': ['No hints available yet.'], 'pseudocode': ''}
-    if problem_name not in HINTS:
-        return default
-    entry = HINTS[problem_name]
-    # If entry already in new per-language shape
-    if isinstance(entry, dict):
-        # If it looks like a language-keyed mapping (contains language keys)
-        if language in entry:
-            return entry.get(language, default)
-        # Backwards-compatible: if entry has 'bullets' treat it as legacy
-        if 'bullets' in entry or 'pseudocode' in entry:
-            return {
-                'bullets': entry.get('bullets', default['bullets']),
-                'pseudocode': entry.get('pseudocode', default['pseudocode'])
-            }
-        # If there's a 'default' key
-        if 'default' in entry:
-            return entry.get('default', default)
-    return default
+    hint = _HINTS_BY_KEY.get((problem_name, language))
+    if hint is None:  # unknown problem or language: resolve without caching
+        hint = _resolve_hints(problem_name, language)
+    return hint
 
 # Global glossary of common CS/algorithms terms
 GLOSSARY = {
@@ -1223,23 +1103,47 @@ PROBLEM_TERMS = {
 def index():
     return send_from_directory('static', 'index.html')
 
+# The problem list and glossary never change after import: serialize them once
+# and let browsers revalidate with an ETag instead of downloading them again.
+def _json_body(obj) -> tuple:
+    body = app.json.response(obj).get_data()  # byte-for-byte what jsonify sends
+    return body, hashlib.sha256(body).hexdigest()[:16]
+
+def _cached_json(cached: tuple) -> Response:
+    body, etag = cached
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+_PROBLEMS_JSON = _json_body([{
+    'name': p['name'],
+    'title': p['title'],
+    'description': p['description']
+} for p in PROBLEMS.values()])
+
 @app.route('/api/problems', methods=['GET'])
 def get_problems():
     """Return list of all problems."""
-    return jsonify([{
-        'name': p['name'],
-        'title': p['title'],
-        'description': p['description']
-    } for p in PROBLEMS.values()])
+    return _cached_json(_PROBLEMS_JSON)
 
 @app.route('/api/problem/<name>', methods=['GET'])
 def get_problem(name):
     """Return problem details including stub code."""
     if name not in PROBLEMS:
         return jsonify({'error': 'Problem not found'}), 404
-    
-    problem = PROBLEMS[name]
     language = request.args.get('language', 'python')
+    if language not in LANGUAGE_EXECUTORS:
+        # Built uncached (the Python fallback stub), so arbitrary strings can't grow the caches
+        return _cached_json(_problem_json.__wrapped__(name, language))
+    return _cached_json(_problem_json(_interned(name), _interned(language)))
+
+# A (problem, language) page is fixed once the catalog is loaded, so each one is
+# assembled and serialized on first request only
+@lru_cache(maxsize=len(PROBLEMS) * len(LANGUAGE_EXECUTORS))
+def _problem_json(name: str, language: str) -> tuple:
+    problem = PROBLEMS[name]
     
     # Get language-specific stub from problem definition
     if 'stubs' in problem and language in problem['stubs']:
@@ -1253,22 +1157,25 @@ def get_problem(name):
         except FileNotFoundError:
             stub_code = f"{problem.get('signature', '')}\n    # Write your code here\n    pass\n"
     
-    return jsonify({
+    hints = get_hints_for(name, language)
+    return _json_body({
         'name': problem['name'],
         'title': problem['title'],
         'description': problem['description'],
         'signature': problem.get('signature', ''),
         'stub': stub_code,
         'language': language,
-        'hints': get_hints_for(name, language),
+        'hints': {'bullets': hint_bullets(hints), 'pseudocode': hints['pseudocode']},
         'terms': PROBLEM_TERMS.get(name, []),
-        'tests': [{'args': str(t['args']), 'expected': str(t['expected'])} for t in problem['tests']]
+        'tests': problem['tests_display']
     })
 
 @app.route('/api/glossary', methods=['GET'])
 def get_glossary():
     """Return the global glossary of terms."""
-    return jsonify(GLOSSARY)
+    return _cached_json(_GLOSSARY_JSON)
+
+_GLOSSARY_JSON = _json_body(GLOSSARY)
 
 @app.route('/api/submit', methods=['POST'])
 def submit_solution():
@@ -1280,35 +1187,45 @@ def submit_solution():
     problem_name = data.get('problem')
     code = data.get('code', '')
     language = data.get('language', 'python')
+    # Formatting tracebacks is only worth it for clients that show them
+    include_traceback = bool(data.get('includeTraceback', False))
     
     if problem_name not in PROBLEMS:
         return jsonify({'error': 'Invalid problem'}), 400
     
     if language not in LANGUAGE_EXECUTORS:
         return jsonify({'error': f'Unsupported language: {language}'}), 400
+    problem_name, language = _interned(problem_name), _interned(language)
     
     problem = PROBLEMS[problem_name]
-    func_name = problem_name if problem_name != 'palindrome' else 'is_palindrome'
+    func_name = problem['func_name']
     
     results = []
     passed = 0
     failed = 0
     
-    executor = LANGUAGE_EXECUTORS[language]
-    
-    # Run test cases
-    for i, test in enumerate(problem['tests']):
+    # A batch-level failure (syntax error, timeout) fails every test in the batch
+    tests = problem['tests']
+    outcomes = execute_many(language, code, problem['test_args'], func_name)
+
+    for i, (test, display, outcome) in enumerate(zip(tests, problem['tests_display'], outcomes)):
         test_result = {
             'test_num': i + 1,
-            'args': str(test['args']),
-            'expected': str(test['expected']),
+            'args': display['args'],
+            'expected': display['expected'],
             'actual': None,
             'passed': False,
             'error': None
         }
         
-        try:
-            result, stdout, stderr = executor(code, test['args'], func_name)
+        if isinstance(outcome, Exception):
+            test_result['error'] = f'{type(outcome).__name__}: {str(outcome)}'
+            if include_traceback:
+                test_result['traceback'] = ''.join(
+                    traceback.format_exception(type(outcome), outcome, outcome.__traceback__))
+            failed += 1
+        else:
+            result, stdout, stderr = outcome
             
             test_result['actual'] = str(result)
             test_result['stdout'] = stdout
@@ -1319,29 +1236,153 @@ def submit_solution():
                 passed += 1
             else:
                 failed += 1
-        except Exception as e:
-            test_result['error'] = f'{type(e).__name__}: {str(e)}'
-            test_result['traceback'] = traceback.format_exc()
-            failed += 1
         
         results.append(test_result)
     
-    return jsonify({
+    return _json_response({
         'passed': passed,
         'failed': failed,
         'total': len(problem['tests']),
         'results': results
     })
 
-def _safe_repr(obj, max_len=200):
+def _safe_repr(obj, max_len=200, repr_func=repr):
     try:
-        s = repr(obj)
+        s = repr_func(obj)
     except Exception as e:
         s = f'<unreprable {type(obj).__name__}: {e}>'
     if len(s) > max_len:
         s = s[:max_len] + '…'
     return s
 
+# Debugger tracing. Only user code exec'd from the request (filename '<string>')
+# is recorded; with breakpoints, only steps on those lines. record(event, frame,
+# value) returns False to stop tracing once enough steps are collected.
+def _settrace_call(func, args, breakpoints, record):
+    def tracer(frame, event, arg):
+        if frame.f_code.co_filename != '<string>':
+            return tracer
+        if event in ('call', 'line', 'return') and (not breakpoints or frame.f_lineno in breakpoints):
+            if not record(event, frame, arg):
+                sys.settrace(None)
+                return None
+        return tracer
+
+    sys.settrace(tracer)
+    try:
+        return func(*args)
+    finally:
+        sys.settrace(None)
+
+# Python 3.12+ (PEP 669): events are dispatched from C and a callback can
+# DISABLE its code location, so library code and lines without a breakpoint
+# stop costing anything after their first hit. Monitoring is process-wide, so
+# one debug session uses it at a time; concurrent sessions fall back to
+# settrace, and callbacks ignore other threads.
+_MONITORING = getattr(sys, 'monitoring', None)
+_MONITORING_LOCK = threading.Lock()
+
+def _monitored_call(func, args, breakpoints, record):
+    mon = _MONITORING
+    tool, events = mon.DEBUGGER_ID, mon.events
+    owner = threading.get_ident()
+
+    def handle(event, code, value=None, disable=mon.DISABLE):
+        if code.co_filename != '<string>':
+            return disable
+        if threading.get_ident() != owner:
+            return None
+        frame = sys._getframe(2)  # handle <- callback <- user code
+        if breakpoints and frame.f_lineno not in breakpoints:
+            return disable
+        if not record(event, frame, value):
+            mon.set_events(tool, 0)
+        return None
+
+    callbacks = {
+        events.PY_START: lambda code, offset: handle('call', code),
+        events.LINE: lambda code, line: handle('line', code),
+        events.PY_RETURN: lambda code, offset, retval: handle('return', code, retval),
+        # settrace also reports 'return' when an exception leaves a frame; this
+        # event can't be disabled
+        events.PY_UNWIND: lambda code, offset, exc: handle('return', code, disable=None),
+    }
+    mon.use_tool_id(tool, 'glider-debug')
+    try:
+        for event, callback in callbacks.items():
+            mon.register_callback(tool, event, callback)
+        mon.set_events(tool, events.PY_START | events.LINE | events.PY_RETURN | events.PY_UNWIND)
+        return func(*args)
+    finally:
+        mon.set_events(tool, 0)
+        for event in callbacks:
+            mon.register_callback(tool, event, None)
+        mon.free_tool_id(tool)
+        mon.restart_events()  # re-arm locations DISABLEd during this session
+
+def _traced_call(func, args, breakpoints, record):
+    """Call func(*args) while feeding user-code steps to record()."""
+    if _MONITORING is not None and _MONITORING.get_tool(_MONITORING.DEBUGGER_ID) is None \
+            and _MONITORING_LOCK.acquire(blocking=False):
+        try:
+            return _monitored_call(func, args, breakpoints, record)
+        finally:
+            _MONITORING_LOCK.release()
+    return _settrace_call(func, args, breakpoints, record)
+
+# Locals are rendered at every recorded step and cut to 200 chars, so for the
+# builtin containers only as much of repr() as survives the cut is built
+_REPR_BRACKETS = {list: '[]', tuple: '()', dict: '{}', set: '{}'}
+
+def _repr_chunks(obj, active):
+    """Yield repr(obj) in pieces, descending into list/tuple/dict/set."""
+    kind = type(obj)
+    brackets = _REPR_BRACKETS.get(kind)
+    if brackets is None or not obj:
+        yield repr(obj)
+        return
+    if id(obj) in active:  # what repr() shows for a container inside itself
+        yield brackets[0] + '...' + brackets[1]
+        return
+    active.add(id(obj))
+    try:
+        yield brackets[0]
+        for i, item in enumerate(obj):
+            if i:
+                yield ', '
+            yield from _repr_chunks(item, active)
+            if kind is dict:
+                yield ': '
+                yield from _repr_chunks(obj[item], active)
+        if kind is tuple and len(obj) == 1:
+            yield ','
+        yield brackets[1]
+    finally:
+        active.discard(id(obj))
+
+def _repr_prefix(obj, limit=200):
+    """repr(obj), stopped once it is longer than limit; _safe_repr cuts the rest."""
+    if type(obj) not in _REPR_BRACKETS:
+        return repr(obj)
+    parts = []
+    size = 0
+    for chunk in _repr_chunks(obj, set()):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            break
+    return ''.join(parts)
+
+# A value of one of these types can't change, so while a variable still holds
+# the same object its rendering from an earlier step is reused
+_IMMUTABLE_LOCALS = frozenset({int, float, complex, bool, str, bytes, type(None)})
+
+# Stepping through the same code again (the usual debugging loop) skips the
+# compile; the filename must stay '<string>' for the tracers
+@lru_cache(maxsize=256)
+def _compile_submission(code: str):
+    return compile(code, '<string>', 'exec')
+
 @app.route('/api/debug', methods=['POST'])
 def debug_solution():
     """Run user code with a simple tracer and return a recorded execution trace.
@@ -1360,9 +1401,10 @@ def debug_solution():
     code = data.get('code', '')
     if problem_name not in PROBLEMS:
         return jsonify({'error': 'Invalid problem'}), 400
+    problem_name = _interned(problem_name)
 
     problem = PROBLEMS[problem_name]
-    func_name = problem_name if problem_name != 'palindrome' else 'is_palindrome'
+    func_name = problem['func_name']
 
     # Determine args
     args = None
@@ -1387,64 +1429,68 @@ def debug_solution():
     # Prepare tracing
     breakpoints = set(int(b) for b in data.get('breakpoints', []) if isinstance(b, int) or str(b).isdigit())
     max_steps = int(data.get('maxSteps', 500))
+    # Line number -> source text; with breakpoints only those lines are recorded
     code_lines = code.splitlines()
+    if breakpoints:
+        line_text = {b: code_lines[b - 1] for b in breakpoints if 1 <= b <= len(code_lines)}
+    else:
+        line_text = dict(enumerate(code_lines, 1))
     trace = []
     truncated = False
+    rendered = {}  # name -> (value, repr) for immutable values seen so far
 
-    def tracer(frame, event, arg):
+    def local_repr(name, value):
+        cached = rendered.get(name)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        text = _safe_repr(value, repr_func=_repr_prefix)
+        if type(value) in _IMMUTABLE_LOCALS:
+            rendered[name] = (value, text)  # holding value keeps its id from being reused
+        return text
+
+    def record(event, frame, value):
+        """Append one step; return False once max_steps have been recorded."""
         nonlocal truncated
-        # Only trace user code submitted via exec (filename will be '<string>')
-        if frame.f_code.co_filename != '<string>':
-            return tracer
-        if event in ('call', 'line', 'return'):
-            line_no = frame.f_lineno
-            record_this = not breakpoints or (line_no in breakpoints)
-            if record_this:
-                try:
-                    locals_snapshot = {k: _safe_repr(v) for k, v in frame.f_locals.items()}
-                except Exception:
-                    locals_snapshot = {}
-                step = {
-                    'event': event,
-                    'line': line_no,
-                    'code': code_lines[line_no-1] if 1 <= line_no <= len(code_lines) else '',
-                    'locals': locals_snapshot,
-                }
-                if event == 'return':
-                    step['return'] = _safe_repr(arg)
-                trace.append(step)
-                if len(trace) >= max_steps:
-                    truncated = True
-                    sys.settrace(None)
-                    return None
-        return tracer
+        line_no = frame.f_lineno
+        try:
+            locals_snapshot = {k: local_repr(k, v) for k, v in frame.f_locals.items()}
+        except Exception:
+            locals_snapshot = {}
+        step = {
+            'event': event,
+            'line': line_no,
+            'code': line_text.get(line_no, ''),
+            'locals': locals_snapshot,
+        }
+        if event == 'return':
+            step['return'] = _safe_repr(value)
+        trace.append(step)
+        if len(trace) >= max_steps:
+            truncated = True
+            return False
+        return True
 
     # Execute code with tracing
     namespace = {}
     stdout_capture = io.StringIO()
     stderr_capture = io.StringIO()
     try:
-        exec(code, namespace)
+        exec(_compile_submission(code), namespace)
         if func_name not in namespace:
             return jsonify({'error': f'Function {func_name} not found in submitted code'}), 400
 
         user_func = namespace[func_name]
-        sys.settrace(tracer)
         with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-            retval = user_func(*args)
+            retval = _traced_call(user_func, args, breakpoints, record)
     except Exception as e:
-        # Ensure tracing is disabled in case of error
-        sys.settrace(None)
-        return jsonify({
+        return _json_response({
             'error': f'{type(e).__name__}: {e}',
             'trace': trace,
             'stdout': stdout_capture.getvalue(),
             'stderr': stderr_capture.getvalue(),
         })
-    finally:
-        sys.settrace(None)
 
-    return jsonify({
+    return _json_response({
         'trace': trace,
         'truncated': truncated,
         'stdout': stdout_capture.getvalue(),
@@ -1453,6 +1499,102 @@ def debug_solution():
         'argsUsed': _safe_repr(args),
     })
 
+# Keep-alive connections to the OpenAI API, reused across /api/ask calls so
+# only a worker's first question (or one after an idle drop) pays for the TCP
+# and TLS handshake
+OPENAI_HOST = 'api.openai.com'
+_OPENAI_IDLE = queue.LifoQueue(maxsize=4)
+_OPENAI_SSL = ssl.create_default_context()
+
+def _openai_post(path: str, payload: dict, api_key: str, timeout: float) -> bytes:
+    """POST JSON to the OpenAI API over a pooled connection and return the body.
+
+    Raises HTTPError for error statuses and URLError for network failures,
+    the same as urlopen().
+    """
+    body = json.dumps(payload).encode('utf-8')
+    headers = {'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'}
+    try:
+        conn, reused = _OPENAI_IDLE.get_nowait(), True
+    except queue.Empty:
+        conn, reused = None, False
+    while True:
+        if conn is None:
+            conn = http.client.HTTPSConnection(OPENAI_HOST, timeout=timeout, context=_OPENAI_SSL)
+        try:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            conn.request('POST', path, body, headers)
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            # The server may have closed an idle connection: retry once, fresh
+            if reused and isinstance(e, ConnectionError):
+                conn, reused = None, False
+                continue
+            raise URLError(e) from e
+    if response.will_close:
+        conn.close()
+    else:
+        try:
+            _OPENAI_IDLE.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    if response.status >= 400:
+        raise HTTPError(f'https://{OPENAI_HOST}{path}', response.status, response.reason,
+                        response.headers, io.BytesIO(data))
+    return data
+
+# The system prompt and the problem-derived context depend only on the request's
+# language, problem and include* flags, so each combination is formatted once.
+# Unsupported languages skip the caches and get the generic tutor prompt.
+@lru_cache(maxsize=64)
+def _system_message(language: str) -> str:
+    language_tutor_names = {
+        'python': 'Python',
+        'javascript': 'JavaScript',
+        'java': 'Java',
+        'cpp': 'C++'
+    }
+    tutor_lang = language_tutor_names.get(language, 'programming')
+    return (
+        f'You are a concise, friendly {tutor_lang} algorithms tutor. '
+        'Explain step by step when helpful, and prefer clarity over verbosity. '
+        f'Use short {tutor_lang} code snippets only if explicitly asked or when crucial. '
+        f'Provide language-specific best practices and idioms for {tutor_lang}.'
+    )
+
+@lru_cache(maxsize=1024)
+def _problem_context(problem_name: Optional[str], language: str, include_description: bool,
+                     include_tests: bool, include_hints: bool) -> tuple:
+    language_names = {
+        'python': 'Python',
+        'javascript': 'JavaScript',
+        'java': 'Java',
+        'cpp': 'C++'
+    }
+    context_parts = [f"The user is working in {language_names.get(language, language)}."]
+    if problem_name:
+        p = PROBLEMS[problem_name]
+        title = p.get('title', problem_name)
+        if include_description:
+            context_parts.append(f"Problem: {title}\nDescription: {p.get('description','')}")
+        if include_tests and p.get('tests'):
+            tests_str = "\n".join([f"- args={t['args']} expected={t['expected']}" for t in p['tests']])
+            context_parts.append(f"Sample tests:\n{tests_str}")
+        if include_hints:
+            h = get_hints_for(problem_name, language)
+            bullets = '• ' + h['bullets'].replace('\n', '\n• ') if h['bullets'] else ''
+            pseudo = h.get('pseudocode', '').strip()
+            if bullets:
+                context_parts.append(f"Hints:\n{bullets}")
+            if pseudo:
+                context_parts.append(f"Pseudocode:\n{pseudo}")
+    return tuple(context_parts)
+
 @app.route('/api/ask', methods=['POST'])
 def ask_ai():
     """Proxy a question to OpenAI with optional problem context.
@@ -1482,38 +1624,21 @@ def ask_ai():
 
     problem_name = data.get('problem')
     language = data.get('language', 'python')
+    # Unknown problems get no problem context; only catalog names are interned
+    problem_name = _interned(problem_name) if problem_name in PROBLEMS else None
+    if language in LANGUAGE_EXECUTORS:
+        language = _interned(language)
+        system_message, problem_context = _system_message, _problem_context
+    else:
+        system_message, problem_context = _system_message.__wrapped__, _problem_context.__wrapped__
     include_description = bool(data.get('includeDescription'))
     include_code = bool(data.get('includeCode'))
     include_hints = bool(data.get('includeHints'))
     include_tests = bool(data.get('includeTests'))
     current_code = data.get('code') or ''
 
-    # Add language context
-    language_names = {
-        'python': 'Python',
-        'javascript': 'JavaScript',
-        'java': 'Java',
-        'cpp': 'C++'
-    }
-    lang_context = f"The user is working in {language_names.get(language, language)}."
-
-    context_parts = [lang_context]
-    if problem_name and problem_name in PROBLEMS:
-        p = PROBLEMS[problem_name]
-        title = p.get('title', problem_name)
-        if include_description:
-            context_parts.append(f"Problem: {title}\nDescription: {p.get('description','')}")
-        if include_tests and p.get('tests'):
-            tests_str = "\n".join([f"- args={t['args']} expected={t['expected']}" for t in p['tests']])
-            context_parts.append(f"Sample tests:\n{tests_str}")
-        if include_hints:
-            h = get_hints_for(problem_name, language)
-            bullets = "\n".join([f"• {b}" for b in h.get('bullets', [])])
-            pseudo = h.get('pseudocode', '').strip()
-            if bullets:
-                context_parts.append(f"Hints:\n{bullets}")
-            if pseudo:
-                context_parts.append(f"Pseudocode:\n{pseudo}")
+    context_parts = list(problem_context(
+        problem_name, language, include_description, include_tests, include_hints))
     if include_code and current_code:
         snippet = current_code.strip()
         if len(snippet) > 4000:
@@ -1525,51 +1650,23 @@ def ask_ai():
         full_user += "\n\n---\nContext:\n" + "\n\n".join(context_parts)
 
     # Compose Chat Completions request
-    language_tutor_names = {
-        'python': 'Python',
-        'javascript': 'JavaScript',
-        'java': 'Java',
-        'cpp': 'C++'
-    }
-    tutor_lang = language_tutor_names.get(language, 'programming')
-    
     payload = {
         'model': OPENAI_MODEL,
         'messages': [
-            {
-                'role': 'system',
-                'content': (
-                    f'You are a concise, friendly {tutor_lang} algorithms tutor. '
-                    'Explain step by step when helpful, and prefer clarity over verbosity. '
-                    f'Use short {tutor_lang} code snippets only if explicitly asked or when crucial. '
-                    f'Provide language-specific best practices and idioms for {tutor_lang}.'
-                )
-            },
+            {'role': 'system', 'content': system_message(language)},
             {'role': 'user', 'content': full_user}
         ],
         'temperature': 0.3,
         'max_tokens': 700,
     }
 
-    req = urlrequest.Request(
-        url='https://api.openai.com/v1/chat/completions',
-        data=json.dumps(payload).encode('utf-8'),
-        headers={
-            'Authorization': f'Bearer {effective_key}',
-            'Content-Type': 'application/json'
-        },
-        method='POST'
-    )
-    # Tolerate environments with strict SSL
-    ctx = ssl.create_default_context()
     try:
-        with urlrequest.urlopen(req, context=ctx, timeout=30) as resp:
-            body = resp.read().decode('utf-8')
-            data = json.loads(body)
-            answer = data.get('choices', [{}])[0].get('message', {}).get('content', '').strip()
-            if not answer:
-                return jsonify({'error': 'Empty response from AI'}), 502
-            return jsonify({'answer': answer})
+        body = _openai_post('/v1/chat/completions', payload, effective_key, timeout=30).decode('utf-8')
+        data = json.loads(body)
+        answer = data.get('choices', [{}])[0].get('message', {}).get('content', '').strip()
+        if not answer:
+            return jsonify({'error': 'Empty response from AI'}), 502
+        return jsonify({'answer': answer})
     except HTTPError as e:
         try:
             err_body = e.read().decode('utf-8')
@@ -1582,12 +1679,19 @@ def ask_ai():
         return jsonify({'error': f'Unexpected error: {e}'}), 500
 
 
+# Only two bodies are possible; the key can change at runtime (admin settings),
+# so the right one is picked per request but never re-encoded. Not cached by
+# browsers, since it is polled as the health check.
+_ASK_STATUS_JSON = {
+    enabled: _json_body({'enabled': enabled,
+                         'message': 'enabled' if enabled else 'missing OPENAI_API_KEY in environment/.env'})[0]
+    for enabled in (False, True)
+}
+
 @app.route('/api/ask/status', methods=['GET'])
 def ask_status():
     """Return whether the AI feature is enabled (OPENAI_API_KEY present)."""
-    enabled = bool(OPENAI_API_KEY)
-    msg = 'enabled' if enabled else 'missing OPENAI_API_KEY in environment/.env'
-    return jsonify({'enabled': enabled, 'message': msg})
+    return Response(_ASK_STATUS_JSON[bool(OPENAI_API_KEY)], mimetype='application/json')
 
 
 # Admin settings endpoints
@@ -1635,7 +1739,7 @@ def update_admin_settings():
     new_model = data.get('openai_model', 'gpt-4').strip()
     
     # Validate key format
-    if new_key and not (new_key.startswith('sk-') and len(new_key) > 20):
+    if new_key and not _is_api_key(new_key):
         return jsonify({'error': 'Invalid API key format. Must start with sk- and be at least 20 characters.'}), 400
     
     # Read existing .env content
@@ -1743,5 +1847,11 @@ def test_openai_key():
     except Exception as e:
         return jsonify({'valid': False, 'error': f'Test failed: {str(e)}'}), 200
 
+# Gunicorn --preload imports this module once in the master and forks the
+# workers, so the catalog and tables built above start out as shared pages.
+# Freezing moves them out of the collector's reach; otherwise each worker's
+# first full collection writes to every object header and copies the pages.
+gc.freeze()
+
 if __name__ == '__main__':
     app.run(debug=True, host='127.0.0.1', port=5000)
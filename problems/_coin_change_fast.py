@@ -0,0 +1,44 @@
+"""
+coin_change(coins, amount): fewest coins making up amount, or -1.
+
+Bottom-up DP over a flat int64 table, compiled with Numba when it is installed.
+The explicit signature compiles it at import (cache=True loads the machine
+code from disk after the first run), so no call pays for the JIT. Non-integer
+input, and installs without NumPy or Numba, run the same loop as plain Python.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional dependencies
+    np = None
+
+UNREACHABLE = 1 << 30
+
+
+def _min_coins(coins, amount, dp):
+    for c in coins:
+        for a in range(c, amount + 1):
+            if dp[a - c] + 1 < dp[a]:
+                dp[a] = dp[a - c] + 1
+    return dp[amount]
+
+
+if np is not None:
+    _min_coins_jit = njit('i8(i8[::1], i8, i8[::1])', cache=True)(_min_coins)
+
+
+def coin_change(coins, amount):
+    """Minimum number of coins summing to amount, or -1 if impossible."""
+    if amount < 0:
+        return -1
+    coins = [c for c in coins if 0 < c <= amount]
+    # The int64 table would truncate float coins or amounts; those run in Python
+    if np is not None and type(amount) is int and all(type(c) is int for c in coins):
+        dp = np.full(amount + 1, UNREACHABLE, dtype=np.int64)
+        dp[0] = 0
+        best = int(_min_coins_jit(np.array(coins, dtype=np.int64), amount, dp))
+    else:
+        dp = [0] + [UNREACHABLE] * amount
+        best = _min_coins(coins, amount, dp)
+    return -1 if best >= UNREACHABLE else best
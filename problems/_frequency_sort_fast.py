@@ -0,0 +1,24 @@
+"""
+frequency_sort(s): characters regrouped by how often they occur.
+
+Characters by frequency (descending), ties by character (ascending). ASCII
+input is counted with one np.bincount over its bytes; anything else, or a
+missing NumPy, goes through collections.Counter.
+"""
+
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+def frequency_sort(s):
+    """Sort characters by frequency desc, then by char asc."""
+    if np is not None and s.isascii():
+        counts = np.bincount(np.frombuffer(s.encode('ascii'), dtype=np.uint8), minlength=128)
+        order = np.lexsort((np.arange(counts.size), -counts))[:np.count_nonzero(counts)]
+        return b''.join(bytes((b,)) * int(counts[b]) for b in order).decode('ascii')
+    counts = Counter(s)
+    return ''.join(c * counts[c] for c in sorted(counts, key=lambda c: (-counts[c], c)))
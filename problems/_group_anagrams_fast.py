@@ -0,0 +1,25 @@
+"""
+group_anagrams(strs): words bucketed by a packed letter-count key.
+
+Lowercase a-z words are keyed by their 26 letter counts packed into a bytes
+object, which hashes and compares as one block instead of a 26-int tuple.
+Other words (and ones with a letter repeated 256+ times) fall back to the
+sorted-string key; a str never equals a bytes key, so the two can't collide.
+Groups come out in first-seen order, each sorted.
+"""
+
+
+def group_anagrams(strs):
+    """Group anagrams by letter counts."""
+    groups = {}
+    counts = bytearray(26)
+    for s in strs:
+        if len(s) < 256 and s.isascii() and s.isalpha() and s.islower():
+            for ch in s.encode('ascii'):
+                counts[ch - 97] += 1
+            key = bytes(counts)
+            counts[:] = bytes(26)
+        else:
+            key = ''.join(sorted(s))
+        groups.setdefault(key, []).append(s)
+    return [sorted(group) for group in groups.values()]
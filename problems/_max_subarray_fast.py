@@ -0,0 +1,40 @@
+"""
+max_subarray(nums): largest sum of a contiguous run, via prefix sums.
+
+With NumPy the best sum ending at each index is the prefix sum there minus the
+smallest earlier prefix sum, so Kadane's loop becomes cumsum, minimum.accumulate
+and one max, all in C. Non-integer input, sums that could leave int64 and
+installs without NumPy use the plain Kadane loop.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+INT64_LIMIT = 1 << 63
+
+
+def _kadane(nums):
+    best = current = nums[0]
+    for x in nums[1:]:
+        current = max(x, current + x)
+        best = max(best, current)
+    return best
+
+
+def max_subarray(nums):
+    """Return the maximum subarray sum of a non-empty list."""
+    if not nums:
+        raise ValueError('max_subarray() arg is an empty sequence')
+    if np is not None:
+        try:
+            a = np.asarray(nums)
+        except (OverflowError, TypeError, ValueError):
+            return _kadane(nums)
+        # Signed ints only, and small enough that no prefix sum can wrap
+        if a.ndim == 1 and a.dtype.kind == 'i' and \
+                max(-int(a.min()), int(a.max())) * (len(a) + 1) < INT64_LIMIT:
+            prefix = np.concatenate(([0], np.cumsum(a, dtype=np.int64)))
+            return int((prefix[1:] - np.minimum.accumulate(prefix[:-1])).max())
+    return _kadane(nums)
@@ -0,0 +1,56 @@
+"""
+merge_intervals(intervals): overlapping and touching ranges folded together.
+
+Sorted by start, an interval opens a new group exactly when its start is past
+every earlier end, so NumPy finds all group boundaries with one stable argsort,
+a running np.maximum.accumulate over the ends and a comparison; each group's
+end is one np.maximum.reduceat. Input already sorted by start is detected with
+one comparison pass and not re-sorted. The (n, 2) int64 array is viewed as
+packed (start, end) records, so the sort gathers each interval as one 16-byte
+record instead of two strided columns. Without NumPy (or for non-integer values
+or values outside int64) the same sort-then-scan runs in Python. Touching
+intervals merge.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+else:
+    INTERVAL = np.dtype([('s', np.int64), ('e', np.int64)], align=True)
+
+
+def _merge_python(intervals):
+    merged = []
+    for start, end in sorted(intervals, key=lambda iv: iv[0]):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def merge_intervals(intervals):
+    """Return the merged intervals, sorted by start."""
+    if not intervals:
+        return []
+    if np is None:
+        return _merge_python(intervals)
+    try:
+        a = np.asarray(intervals)
+    except (OverflowError, TypeError, ValueError):
+        return _merge_python(intervals)
+    if a.ndim != 2 or a.shape[1] != 2 or a.dtype.kind != 'i':
+        return _merge_python(intervals)  # ragged, floats, bigints, ...
+    # Integer input only: the record view reinterprets the raw int64 bytes
+    a = np.ascontiguousarray(a, dtype=np.int64).view(INTERVAL).ravel()
+    starts = a['s']
+    if (starts[1:] < starts[:-1]).any():  # already-sorted input skips the sort
+        a = a[starts.argsort(kind='stable')]
+        starts = a['s']
+    ends = np.maximum.accumulate(a['e'])
+    new_group = np.empty(len(a), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = starts[1:] > ends[:-1]
+    firsts = np.flatnonzero(new_group)
+    return np.stack([starts[firsts], np.maximum.reduceat(a['e'], firsts)], axis=1).tolist()
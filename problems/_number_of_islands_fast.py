@@ -0,0 +1,93 @@
+"""
+number_of_islands(grid): 4-connected '1' regions counted by union-find.
+
+The '1'/'0' grid is joined into one ASCII bytes object and read with
+np.frombuffer as a dense uint8 array, which is swept once in row-major order by
+a Numba kernel that unions each land cell with its up and left neighbours
+(int32 parents, union by rank, path halving). Every land cell starts as its own
+island and every successful union merges two. Without NumPy and Numba an
+iterative DFS runs over the lists in Python.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional dependencies
+    np = None
+
+
+def _count_python(grid):
+    rows, cols = len(grid), len(grid[0])
+    seen = [[cell != '1' for cell in row] for row in grid]
+    islands = 0
+    for r in range(rows):
+        for c in range(cols):
+            if seen[r][c]:
+                continue
+            islands += 1
+            seen[r][c] = True
+            stack = [(r, c)]
+            while stack:
+                y, x = stack.pop()
+                for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+                    if 0 <= ny < rows and 0 <= nx < cols and not seen[ny][nx]:
+                        seen[ny][nx] = True
+                        stack.append((ny, nx))
+    return islands
+
+
+if np is not None:
+    @njit('i8(i4[::1], i8)', cache=True)
+    def _find(parent, x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]  # path halving
+            x = parent[x]
+        return x
+
+    @njit('i8(i4[::1], u1[::1], i8, i8)', cache=True)
+    def _union(parent, rank, a, b):
+        a, b = _find(parent, a), _find(parent, b)
+        if a == b:
+            return 0
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        return 1
+
+    @njit('i8(u1[:, ::1])', cache=True)
+    def _count(g):
+        rows, cols = g.shape
+        parent = np.arange(rows * cols, dtype=np.int32)
+        rank = np.zeros(rows * cols, np.uint8)
+        islands = 0
+        for y in range(rows):
+            for x in range(cols):
+                if not g[y, x]:
+                    continue
+                cell = y * cols + x
+                islands += 1
+                if y > 0 and g[y - 1, x]:
+                    islands -= _union(parent, rank, cell, cell - cols)
+                if x > 0 and g[y, x - 1]:
+                    islands -= _union(parent, rank, cell, cell - 1)
+        return islands
+
+
+def number_of_islands(grid):
+    """Count 4-connected components of '1' cells."""
+    if not grid or not grid[0]:
+        return 0
+    if np is None:
+        return _count_python(grid)
+    cols = len(grid[0])
+    try:
+        rows = [''.join(row) for row in grid]
+        flat = ''.join(rows).encode('ascii')
+    except (TypeError, UnicodeEncodeError):  # non-str or non-ASCII cells
+        return _count_python(grid)
+    if any(len(row) != cols or len(text) != cols for row, text in zip(grid, rows)):
+        return _count_python(grid)  # ragged rows or multi-character cells
+    g = (np.frombuffer(flat, np.uint8) == ord('1')).view(np.uint8)
+    return int(_count(g.reshape(len(grid), cols)))
@@ -0,0 +1,72 @@
+"""
+product_except_self(nums): products of all other elements, no division.
+
+One Numba kernel writes prefix products on the way up and folds suffix products
+in on the way down: a single int64 buffer, no division, no boxed ints. int64
+would silently wrap, so the kernel is only used when the product of all
+nonzero magnitudes (a bound on every prefix, suffix and answer) fits in 62
+bits, and on an int32 copy (half the bytes moved) when it fits in 30; otherwise,
+or without NumPy and Numba, the same two passes run on Python ints.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional dependencies
+    np = None
+
+INT32_SAFE_BITS = 30  # headroom for float error in the log2 estimate
+INT64_SAFE_BITS = 62
+
+
+def _product_python(nums):
+    out = [1] * len(nums)
+    prefix = 1
+    for i, x in enumerate(nums):
+        out[i] = prefix
+        prefix *= x
+    suffix = 1
+    for i in range(len(nums) - 1, -1, -1):
+        out[i] *= suffix
+        suffix *= nums[i]
+    return out
+
+
+if np is not None:
+    @njit(['i4[::1](i4[::1])', 'i8[::1](i8[::1])'], cache=True)
+    def _product_kernel(a):
+        out = np.empty_like(a)
+        prefix = 1
+        for i in range(a.size):
+            out[i] = prefix
+            prefix *= a[i]
+        suffix = 1
+        for i in range(a.size - 1, -1, -1):
+            out[i] *= suffix
+            suffix *= a[i]
+        return out
+
+
+def _product_bits(a):
+    nonzero = np.abs(a[a != 0]).astype(np.float64)
+    return float(np.log2(nonzero).sum())
+
+
+def product_except_self(nums):
+    """Return an array where each element is the product of all other elements."""
+    if np is None or not nums:
+        return _product_python(nums)
+    try:
+        a = np.asarray(nums)
+    except (OverflowError, TypeError, ValueError):
+        return _product_python(nums)
+    if a.ndim != 1 or a.dtype.kind != 'i':  # floats, strings, bigints, ...
+        return _product_python(nums)
+    a = a.astype(np.int64, copy=False)
+    # Only signed-integer arrays reach the width choice below
+    bits = _product_bits(a)
+    if bits < INT32_SAFE_BITS:
+        return _product_kernel(a.astype(np.int32)).tolist()
+    if bits < INT64_SAFE_BITS:
+        return _product_kernel(a).tolist()
+    return _product_python(nums)
@@ -0,0 +1,47 @@
+"""
+top_k_frequent(nums, k): the k most common values, ties by value.
+
+Most frequent first, ties by value (ascending). Integer input goes through
+NumPy: np.unique counts in C, and np.partition finds the k-th largest count
+without sorting every distinct value. Other input, or no NumPy, uses
+heapq.nsmallest, which keeps only k candidates: O(u log k) for u distinct values.
+"""
+
+from collections import Counter
+from heapq import nsmallest
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+def _rank(item):
+    value, count = item
+    return -count, value
+
+
+def _top_k_numpy(a, k):
+    values, counts = np.unique(a, return_counts=True)  # values come out ascending
+    k = min(k, len(values))
+    if k <= 0:
+        return []
+    threshold = np.partition(counts, len(counts) - k)[len(counts) - k]
+    above = np.flatnonzero(counts > threshold)
+    # Ties at the threshold are already in ascending value order
+    ties = np.flatnonzero(counts == threshold)[:k - len(above)]
+    picked = np.concatenate((above, ties))
+    order = np.lexsort((values[picked], -counts[picked]))
+    return values[picked][order].tolist()
+
+
+def top_k_frequent(nums, k):
+    """Return k most frequent elements."""
+    if np is not None and nums:
+        try:
+            a = np.asarray(nums)
+        except (OverflowError, ValueError):
+            a = None
+        if a is not None and a.ndim == 1 and a.dtype.kind in 'iu':
+            return _top_k_numpy(a, k)
+    return [value for value, _ in nsmallest(k, Counter(nums).items(), key=_rank)]
@@ -0,0 +1,46 @@
+"""
+two_sum_sorted(nums, target): index pair summing to target in a sorted list.
+
+Two pointers moving inward, compiled with Numba over an int64 array; the
+pointer updates are branchless (l += d > 0; r -= d < 0). Non-integer nums or
+target, values needing more than 61 bits (where the difference could wrap) and
+installs without NumPy and Numba use the same loop in Python.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional dependencies
+    np = None
+
+INT64_SAFE = 1 << 61  # keeps target - a[l] - a[r] inside int64
+
+
+def _two_pointer(nums, target):
+    lo, hi = 0, len(nums) - 1
+    while lo < hi:
+        d = target - nums[lo] - nums[hi]
+        if d == 0:
+            return lo, hi
+        lo += d > 0
+        hi -= d < 0
+    return -1, -1
+
+
+if np is not None:
+    _two_pointer_jit = njit('UniTuple(i8, 2)(i8[::1], i8)', cache=True)(_two_pointer)
+
+
+def two_sum_sorted(nums, target):
+    """Two-pointer approach on sorted input."""
+    if np is not None and len(nums) > 1 and type(target) is int and abs(target) < INT64_SAFE:
+        try:
+            a = np.asarray(nums)
+        except (OverflowError, TypeError, ValueError):
+            a = None
+        # The JIT path is integer-only: floats would be truncated by the cast
+        if a is not None and a.ndim == 1 and a.dtype.kind == 'i' and \
+                max(-int(a[0]), int(a[-1])) < INT64_SAFE:
+            lo, hi = _two_pointer_jit(a.astype(np.int64, copy=False), target)
+            return [int(lo), int(hi)]
+    return list(_two_pointer(nums, target))
@@ -0,0 +1,225 @@
+// Long-lived Java worker used by app.py's WorkerPool.
+// Reads one base64-encoded TestRunner.java per line on stdin, compiles it in
+// memory with javax.tools, runs TestRunner.main from a fresh class loader and
+// answers with a single JSON line: {"status": ..., "stdout": ..., "stderr": ...}.
+// Compiled classes are cached by SHA-256 of the source, so resubmitting the
+// same program skips javac entirely.
+//
+// Launched in source-file mode (`java Dispatcher.java`, JDK 11+).
+
+import java.io.ByteArrayOutputStream;
+import java.io.BufferedReader;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.net.URI;
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.util.Base64;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+
+import javax.tools.Diagnostic;
+import javax.tools.DiagnosticCollector;
+import javax.tools.FileObject;
+import javax.tools.ForwardingJavaFileManager;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileObject;
+import javax.tools.SimpleJavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+public class Dispatcher {
+
+    static final class Source extends SimpleJavaFileObject {
+        private final String code;
+
+        Source(String name, String code) {
+            super(URI.create("string:///" + name + Kind.SOURCE.extension), Kind.SOURCE);
+            this.code = code;
+        }
+
+        @Override
+        public CharSequence getCharContent(boolean ignoreEncodingErrors) {
+            return code;
+        }
+    }
+
+    static final class ClassBytes extends SimpleJavaFileObject {
+        final ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+
+        ClassBytes(String name) {
+            super(URI.create("bytes:///" + name.replace('.', '/') + Kind.CLASS.extension), Kind.CLASS);
+        }
+
+        @Override
+        public OutputStream openOutputStream() {
+            return bytes;
+        }
+    }
+
+    static final class MemoryFileManager extends ForwardingJavaFileManager<StandardJavaFileManager> {
+        final Map<String, ClassBytes> classes = new HashMap<>();
+
+        MemoryFileManager(StandardJavaFileManager fileManager) {
+            super(fileManager);
+        }
+
+        @Override
+        public JavaFileObject getJavaFileForOutput(Location location, String name,
+                                                   JavaFileObject.Kind kind, FileObject sibling) {
+            ClassBytes out = new ClassBytes(name);
+            classes.put(name, out);
+            return out;
+        }
+
+        Map<String, byte[]> compiled() {
+            Map<String, byte[]> result = new HashMap<>();
+            for (Map.Entry<String, ClassBytes> e : classes.entrySet()) {
+                result.put(e.getKey(), e.getValue().bytes.toByteArray());
+            }
+            return result;
+        }
+    }
+
+    static final class MemoryClassLoader extends ClassLoader {
+        private final Map<String, byte[]> classes;
+
+        MemoryClassLoader(Map<String, byte[]> classes) {
+            super(ClassLoader.getPlatformClassLoader());
+            this.classes = classes;
+        }
+
+        @Override
+        protected Class<?> findClass(String name) throws ClassNotFoundException {
+            byte[] b = classes.get(name);
+            if (b == null) {
+                throw new ClassNotFoundException(name);
+            }
+            return defineClass(name, b, 0, b.length);
+        }
+    }
+
+    private static final JavaCompiler COMPILER = ToolProvider.getSystemJavaCompiler();
+    private static final StandardJavaFileManager FILE_MANAGER =
+        COMPILER == null ? null : COMPILER.getStandardFileManager(null, null, StandardCharsets.UTF_8);
+
+    private static final int CACHE_SIZE = 500;
+    private static final Map<String, Map<String, byte[]>> CACHE =
+        new LinkedHashMap<String, Map<String, byte[]>>(16, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<String, Map<String, byte[]>> eldest) {
+                return size() > CACHE_SIZE;
+            }
+        };
+
+    public static void main(String[] args) throws IOException {
+        PrintStream protocol = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        // Load and JIT the compiler before the first real submission arrives
+        handle("public class TestRunner { public static void main(String[] args) {} }");
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        String line;
+        while ((line = in.readLine()) != null) {
+            String source = new String(Base64.getDecoder().decode(line.trim()), StandardCharsets.UTF_8);
+            protocol.println(handle(source));
+        }
+    }
+
+    static String handle(String source) {
+        String key = sha256(source);
+        Map<String, byte[]> cached = CACHE.get(key);
+        if (cached != null) {
+            return run(cached);
+        }
+        if (COMPILER == null) {
+            return reply("compile_error", "", "No Java compiler available; a JDK (not just a JRE) is required\n");
+        }
+        DiagnosticCollector<JavaFileObject> diagnostics = new DiagnosticCollector<>();
+        MemoryFileManager fileManager = new MemoryFileManager(FILE_MANAGER);
+        boolean ok = COMPILER.getTask(null, fileManager, diagnostics, null, null,
+                                      List.of(new Source("TestRunner", source))).call();
+        if (!ok) {
+            StringBuilder sb = new StringBuilder();
+            for (Diagnostic<? extends JavaFileObject> d : diagnostics.getDiagnostics()) {
+                sb.append(d).append('\n');
+            }
+            return reply("compile_error", "", sb.toString());
+        }
+        Map<String, byte[]> classes = fileManager.compiled();
+        CACHE.put(key, classes);
+        return run(classes);
+    }
+
+    static String sha256(String source) {
+        try {
+            byte[] digest = MessageDigest.getInstance("SHA-256").digest(source.getBytes(StandardCharsets.UTF_8));
+            StringBuilder sb = new StringBuilder(digest.length * 2);
+            for (byte b : digest) {
+                sb.append(String.format("%02x", b));
+            }
+            return sb.toString();
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException(e);
+        }
+    }
+
+    static String run(Map<String, byte[]> classes) {
+        ByteArrayOutputStream out = new ByteArrayOutputStream();
+        ByteArrayOutputStream err = new ByteArrayOutputStream();
+        PrintStream oldOut = System.out;
+        PrintStream oldErr = System.err;
+        String status = "ok";
+        try {
+            System.setOut(new PrintStream(out, true, "UTF-8"));
+            System.setErr(new PrintStream(err, true, "UTF-8"));
+            Class<?> runner = new MemoryClassLoader(classes).loadClass("TestRunner");
+            runner.getMethod("main", String[].class).invoke(null, (Object) new String[0]);
+        } catch (InvocationTargetException e) {
+            status = "runtime_error";
+            e.getCause().printStackTrace();
+        } catch (ReflectiveOperationException | RuntimeException | IOException e) {
+            status = "runtime_error";
+            e.printStackTrace();
+        } finally {
+            System.out.flush();
+            System.err.flush();
+            System.setOut(oldOut);
+            System.setErr(oldErr);
+        }
+        return reply(status,
+                     new String(out.toByteArray(), StandardCharsets.UTF_8),
+                     new String(err.toByteArray(), StandardCharsets.UTF_8));
+    }
+
+    static String reply(String status, String stdout, String stderr) {
+        return "{\"status\":" + quote(status) + ",\"stdout\":" + quote(stdout) + ",\"stderr\":" + quote(stderr) + "}";
+    }
+
+    static String quote(String s) {
+        StringBuilder sb = new StringBuilder(s.length() + 2).append('"');
+        for (int i = 0; i < s.length(); i++) {
+            char c = s.charAt(i);
+            switch (c) {
+                case '"': sb.append("\\\""); break;
+                case '\\': sb.append("\\\\"); break;
+                case '\n': sb.append("\\n"); break;
+                case '\r': sb.append("\\r"); break;
+                case '\t': sb.append("\\t"); break;
+                default:
+                    if (c < 0x20) {
+                        sb.append(String.format("\\u%04x", (int) c));
+                    } else {
+                        sb.append(c);
+                    }
+            }
+        }
+        return sb.append('"').toString();
+    }
+}
@@ -0,0 +1,163 @@
+"""
+Long-lived Python worker used by app.py's WorkerPool.
+
+Reads one base64-encoded JSON request ({code, tests, fn}) per line on stdin and
+answers with a single JSON line {status, outcomes}. On POSIX every request runs
+in a forked child under CPU, memory and wall-clock limits, so an infinite loop,
+os._exit() or a runaway allocation only takes down that child.
+"""
+
+import ast
+import base64
+import io
+import json
+import os
+import signal
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+# Modules solutions commonly import; loading them here makes them free in children
+import bisect, collections, functools, heapq, itertools, math, string  # noqa: E401,F401
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits, requests run inline
+    resource = None
+
+CPU_SECONDS = 2
+MEMORY_BYTES = 512 * 1024 * 1024
+WALL_SECONDS = 5
+
+
+def _error(exc):
+    """Describe an exception; literal args let the server rebuild it as raised."""
+    try:
+        message = str(exc)
+    except Exception:
+        message = f'<unprintable {type(exc).__name__}>'
+    error = {'error_type': type(exc).__name__, 'error': message}
+    try:
+        args = repr(exc.args)
+        ast.literal_eval(args)
+        error['args'] = args
+    except Exception:
+        pass
+    return error
+
+
+def invoke(func, args):
+    """Call the prepared function on one test's args, capturing its output."""
+    stdout_capture = io.StringIO()
+    stderr_capture = io.StringIO()
+    try:
+        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+            result = func(*args)
+    except Exception as e:
+        return _error(e)
+    outcome = {'stdout': stdout_capture.getvalue(), 'stderr': stderr_capture.getvalue()}
+    outcome.update(encode_result(result))
+    return outcome
+
+
+def encode_result(result):
+    """Encode a return value so the server can rebuild it with its type.
+
+    Literals (tuples, sets, bytes, ...) travel as their repr for
+    ast.literal_eval; inf/nan as JSON; anything else only as its str().
+    """
+    try:
+        text = repr(result)
+        ast.literal_eval(text)
+        return {'repr': text}
+    except Exception:
+        pass
+    try:
+        json.dumps(result)
+        return {'result': result}
+    except Exception:
+        pass
+    try:
+        return {'str': str(result)}
+    except Exception as e:
+        return {'str': f'<unprintable {type(result).__name__}: {e}>'}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(code):
+    # Filled in the server process, so a resubmitted solution reaches its
+    # forked child already compiled
+    return compile(code, '<string>', 'exec')
+
+
+def prepare(code, fn):
+    """Exec the submission into a fresh namespace and return the function to test."""
+    namespace = {}
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        exec(_compile(code), namespace)
+    func = namespace.get(fn)
+    if not func:
+        raise NameError(f"Function {fn} not found")
+    return func
+
+
+def run(request):
+    """Prepare the submission once and invoke it for every test's args."""
+    try:
+        func = prepare(request['code'], request['fn'])
+    except Exception as e:
+        return dict(status='error', **_error(e))
+    return {'status': 'ok', 'outcomes': [invoke(func, args) for args in request['tests']]}
+
+
+def run_limited(request):
+    """Run a request in a forked child with rlimits; report crashes and timeouts."""
+    try:
+        _compile(request['code'])
+    except Exception:
+        pass  # reported by the child, like any other exec failure
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(r)
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            resource.setrlimit(resource.RLIMIT_CPU, (CPU_SECONDS, CPU_SECONDS))
+            resource.setrlimit(resource.RLIMIT_AS, (MEMORY_BYTES, MEMORY_BYTES))
+            signal.alarm(WALL_SECONDS)
+            reply = json.dumps(run(request)).encode('utf-8')
+            with os.fdopen(w, 'wb') as f:
+                f.write(reply)
+        finally:
+            os._exit(0)
+
+    os.close(w)
+    with os.fdopen(r, 'rb') as f:
+        data = f.read()
+    _, status = os.waitpid(pid, 0)
+    try:
+        return json.loads(data)
+    except ValueError:
+        pass
+    if os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        if sig in (signal.SIGALRM, signal.SIGXCPU, signal.SIGKILL):
+            return {'status': 'timeout'}
+        reason = f'killed by signal {sig}'
+    else:
+        reason = f'exit code {os.WEXITSTATUS(status)}'
+    return {'status': 'error', 'error_type': 'RuntimeError', 'error': f'Python process died ({reason})'}
+
+
+def main():
+    limited = hasattr(os, 'fork') and resource is not None
+    for line in sys.stdin.buffer:
+        request = json.loads(base64.b64decode(line))
+        reply = run_limited(request) if limited else run(request)
+        sys.stdout.write(json.dumps(reply) + '\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
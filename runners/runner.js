@@ -0,0 +1,95 @@
+// Long-lived JavaScript worker used by app.py's WorkerPool.
+// Reads one base64-encoded program per line on stdin, runs it in a fresh
+// vm context and answers with a single JSON line: {status, stdout, stderr}.
+// The context mirrors a CommonJS script: console, a process stand-in, a
+// whitelisted require(), module/exports, timers and the common web globals.
+'use strict';
+
+const readline = require('readline');
+const util = require('util');
+const vm = require('vm');
+
+const timeoutMs = Number(process.argv[2]) || 5000;
+
+// Node built-ins a submission may require(); none of them reach the file
+// system, the network or child processes
+const ALLOWED_MODULES = new Set([
+    'assert', 'buffer', 'events', 'querystring', 'string_decoder', 'url', 'util',
+]);
+
+function sandboxRequire(name) {
+    const bare = String(name).replace(/^node:/, '');
+    if (!ALLOWED_MODULES.has(bare)) {
+        throw new Error(`require('${name}') is not available in the sandbox`);
+    }
+    return require(bare);
+}
+
+// Host globals handed through unchanged (when this Node version has them)
+const SHARED_GLOBALS = [
+    'Buffer', 'URL', 'URLSearchParams', 'TextEncoder', 'TextDecoder',
+    'atob', 'btoa', 'structuredClone', 'queueMicrotask',
+    'clearTimeout', 'clearInterval', 'clearImmediate',
+];
+
+function run(source) {
+    const stdout = [];
+    const stderr = [];
+    const sink = (buf) => (...args) => { buf.push(util.format(...args) + '\n'); };
+    const write = (buf) => (chunk) => { buf.push(String(chunk)); return true; };
+    // Timers are accepted, but anything still pending when the submission's
+    // synchronous code finishes is cancelled so it can't outlive the request
+    const pending = { timeout: [], interval: [], immediate: [] };
+    const track = (start, list) => (...args) => { const t = start(...args); list.push(t); return t; };
+    const module = { exports: {} };
+    const sandbox = {
+        console: {
+            log: sink(stdout),
+            info: sink(stdout),
+            debug: sink(stdout),
+            warn: sink(stderr),
+            error: sink(stderr),
+        },
+        process: {
+            argv: ['node', 'solution.js'],
+            env: {},
+            platform: process.platform,
+            version: process.version,
+            versions: process.versions,
+            stdout: { write: write(stdout) },
+            stderr: { write: write(stderr) },
+            hrtime: process.hrtime,
+            nextTick: (fn, ...args) => queueMicrotask(() => fn(...args)),
+            exit: (code = 0) => { throw new Error(`process.exit(${code}) called`); },
+        },
+        require: sandboxRequire,
+        module,
+        exports: module.exports,
+        __filename: 'solution.js',
+        __dirname: '.',
+        setTimeout: track(setTimeout, pending.timeout),
+        setInterval: track(setInterval, pending.interval),
+        setImmediate: track(setImmediate, pending.immediate),
+    };
+    for (const name of SHARED_GLOBALS) {
+        if (name in globalThis) sandbox[name] = globalThis[name];
+    }
+    sandbox.global = sandbox;
+    let status = 'ok';
+    try {
+        vm.runInNewContext(source, sandbox, { filename: 'solution.js', timeout: timeoutMs });
+    } catch (e) {
+        status = e && e.code === 'ERR_SCRIPT_EXECUTION_TIMEOUT' ? 'timeout' : 'runtime_error';
+        stderr.push(`${e && e.stack ? e.stack : e}\n`);
+    } finally {
+        pending.timeout.forEach(clearTimeout);
+        pending.interval.forEach(clearInterval);
+        pending.immediate.forEach(clearImmediate);
+    }
+    return { status, stdout: stdout.join(''), stderr: stderr.join('') };
+}
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    const source = Buffer.from(line, 'base64').toString('utf8');
+    process.stdout.write(JSON.stringify(run(source)) + '\n');
+});
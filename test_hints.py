@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import requests
 
 base = 'http://127.0.0.1:5000'
+session = requests.Session()
+# one keep-alive connection per concurrent fetch
+session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=16))
+session.headers['Accept-Encoding'] = 'gzip'
 
+# Responses are cached per process; call fetch.cache_clear() after restarting
+# the server so repeated runs see the new hints
+@lru_cache(maxsize=64)
 def fetch(name, lang):
-    r = requests.get(f'{base}/api/problem/{name}', params={'language': lang})
+    r = session.get(f'{base}/api/problem/{name}', params={'language': lang})
     r.raise_for_status()
     return r.json()
 
@@ -14,12 +23,14 @@ def fetch(name, lang):
 def main():
     problems = ['summation','palindrome','two_sum']
     langs = ['python','javascript','java','cpp']
+    jobs = [(prob, l) for prob in problems for l in langs]
+    with ThreadPoolExecutor(len(jobs)) as ex:
+        results = dict(zip(jobs, ex.map(lambda pl: fetch(*pl), jobs)))
     ok = True
     for prob in problems:
         hints = {}
         for l in langs:
-            j = fetch(prob, l)
-            h = j.get('hints', {})
+            h = results[prob, l].get('hints', {})
             hints[l] = (h.get('pseudocode',''), tuple(h.get('bullets',[])))
         # Check that at least two languages differ
         uniq = set(hints.values())
@@ -33,4 +44,3 @@ def main():
 
 if __name__=='__main__':
     main()
-    main()
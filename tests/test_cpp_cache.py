@@ -0,0 +1,61 @@
+"""Trust checks and recovery in the compiled C++ binary cache."""
+
+import os
+import shutil
+import stat
+
+import pytest
+
+import app as glider
+
+CODE = "int summation(int a, int b) {\n    return a + b;\n}\n"
+
+
+def _mode(path):
+    return stat.S_IMODE(os.lstat(path).st_mode)
+
+
+def test_private_dir_is_owner_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(glider, 'SCRATCH_ROOT', str(tmp_path))
+    path = glider._private_dir('cache')
+    assert path == str(tmp_path / 'cache')
+    assert _mode(path) == 0o700
+
+
+def test_private_dir_closes_an_open_dir_we_own(tmp_path, monkeypatch):
+    monkeypatch.setattr(glider, 'SCRATCH_ROOT', str(tmp_path))
+    (tmp_path / 'cache').mkdir(mode=0o777)
+    os.chmod(tmp_path / 'cache', 0o777)
+    assert glider._private_dir('cache') == str(tmp_path / 'cache')
+    assert _mode(tmp_path / 'cache') == 0o700
+
+
+def test_private_dir_ignores_a_symlink(tmp_path, monkeypatch):
+    monkeypatch.setattr(glider, 'SCRATCH_ROOT', str(tmp_path))
+    (tmp_path / 'elsewhere').mkdir()
+    (tmp_path / 'cache').symlink_to(tmp_path / 'elsewhere')
+    path = glider._private_dir('cache')
+    assert os.path.dirname(path) == str(tmp_path) and not os.path.islink(path)
+    assert _mode(path) == 0o700
+
+
+@pytest.mark.skipif(not hasattr(os, 'geteuid') or os.geteuid() != 0, reason='needs root to chown')
+def test_private_dir_ignores_a_dir_owned_by_someone_else(tmp_path, monkeypatch):
+    monkeypatch.setattr(glider, 'SCRATCH_ROOT', str(tmp_path))
+    (tmp_path / 'cache').mkdir(mode=0o700)
+    os.chown(tmp_path / 'cache', 65534, 65534)
+    path = glider._private_dir('cache')
+    assert path != str(tmp_path / 'cache')
+    assert os.lstat(path).st_uid == os.getuid() and _mode(path) == 0o700
+
+
+@pytest.mark.skipif(shutil.which('g++') is None, reason='g++ not installed')
+@pytest.mark.parametrize('planted', [None, b'not a program'])
+def test_cached_binary_that_cannot_run_is_rebuilt(tmp_path, monkeypatch, planted):
+    missing = tmp_path / 'solution'
+    if planted is not None:
+        missing.write_bytes(planted)
+        os.chmod(missing, 0o600)  # unrunnable, like a half-evicted or foreign file
+    monkeypatch.setattr(glider, '_compile_cache_get', lambda key: str(missing))
+    [(result, stdout, stderr)] = glider.execute_cpp(CODE, [(2, 3)], 'summation')
+    assert result == 5
@@ -0,0 +1,71 @@
+"""Debugger locals keep the plain repr() cut to 200 chars they always had."""
+
+import random
+from collections import OrderedDict, deque
+
+import pytest
+
+import app as glider
+
+
+def _expected(obj, max_len=200):
+    s = repr(obj)
+    return s[:max_len] + '…' if len(s) > max_len else s
+
+
+def _random_value(rng, depth=0):
+    leaves = [
+        lambda: rng.randint(-10**6, 10**6),
+        lambda: rng.random(),
+        lambda: 'é' * rng.randint(0, 5) + "a'b\"c\n" * rng.randint(0, 3),
+        lambda: None,
+        lambda: b'\x00x',
+        lambda: (rng.random() < 0.5),
+    ]
+    if depth > 3 or rng.random() < 0.3:
+        return rng.choice(leaves)()
+    n = rng.choice([0, 1, 2, 5, 60])
+    kind = rng.choice(['list', 'tuple', 'dict', 'set', 'deque', 'ordered'])
+    items = [_random_value(rng, depth + 1) for _ in range(n)]
+    if kind == 'list':
+        return items
+    if kind == 'tuple':
+        return tuple(items)
+    if kind == 'deque':
+        return deque(items)
+    keys = [rng.randint(0, 1000) for _ in range(n)]
+    if kind == 'set':
+        return set(keys)
+    return (dict if kind == 'dict' else OrderedDict)(zip(keys, items))
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_matches_repr_cut_to_200_chars(seed):
+    value = _random_value(random.Random(seed))
+    assert glider._safe_repr(value, repr_func=glider._repr_prefix) == _expected(value)
+
+
+def test_self_referencing_containers():
+    items = [1]
+    items.append(items)
+    table = {'me': None}
+    table['me'] = table
+    pair = ([],)
+    pair[0].append(pair)
+    for value in (items, table, pair, [items] * 100):
+        assert glider._safe_repr(value, repr_func=glider._repr_prefix) == _expected(value)
+
+
+def test_large_container_shown_as_before():
+    grid = [[0] * 1000 for _ in range(1000)]
+    assert glider._safe_repr(grid, repr_func=glider._repr_prefix) == _expected(grid)
+
+
+def test_debug_trace_locals_use_repr():
+    client = glider.app.test_client()
+    code = "def summation(a, b):\n    s = 'x' * 300\n    t = (a,)\n    return a + b\n"
+    reply = client.post('/api/debug', json={'code': code, 'problem': 'summation', 'args': [2, 3]})
+    steps = reply.get_json()['trace']
+    last = steps[-1]['locals']
+    assert last['s'] == repr('x' * 300)[:200] + '…'
+    assert last['t'] == '(2,)'
@@ -0,0 +1,320 @@
+"""Checks for the optimized reference kernels in problems/_*_fast.py.
+
+Every kernel must agree with the catalog's expected values and with a
+brute-force oracle, both on its NumPy/Numba path and on the pure-Python
+fallback (forced by setting the module's np to None).
+"""
+
+import copy
+import importlib
+import itertools
+import json
+import math
+import random
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from problems._max_subarray_fast import max_subarray
+from problems._merge_intervals_fast import merge_intervals
+from problems._product_except_self_fast import (_product_python,
+                                                product_except_self)
+from problems._three_sum_fast import three_sum
+from problems._two_sum_sorted_fast import two_sum_sorted
+
+KERNELS = [
+    'coin_change', 'frequency_sort', 'group_anagrams', 'max_subarray',
+    'merge_intervals', 'number_of_islands', 'product_except_self', 'three_sum',
+    'top_k_frequent', 'two_sum_sorted',
+]
+
+CATALOG = json.loads((Path(__file__).resolve().parent.parent / 'data' / 'problems.json')
+                     .read_text(encoding='utf-8'))
+
+# Dyadic floats keep sums and products exact, so results compare with ==
+FLOATS = [-2.5, -1.5, -1.0, -0.5, -0.25, 0.0, 0.25, 0.5, 1.0, 1.5, 2.0, 3.0]
+
+
+@pytest.fixture(params=['fast', 'python'])
+def kernel(request, monkeypatch):
+    """Return a loader for the named kernel on the NumPy or Python path."""
+    def load(name):
+        module = importlib.import_module(f'problems._{name}_fast')
+        if request.param == 'python':
+            if not hasattr(module, 'np'):
+                pytest.skip('no NumPy path to switch off')
+            monkeypatch.setattr(module, 'np', None)
+        elif getattr(module, 'np', True) is None:
+            pytest.skip('NumPy/Numba not installed')
+        return getattr(module, name)
+    return load
+
+
+@pytest.mark.parametrize('name,case', [
+    (name, case) for name in KERNELS for case in CATALOG[name]['tests']
+])
+def test_catalog_cases(kernel, name, case):
+    assert kernel(name)(*copy.deepcopy(case['args'])) == case['expected']
+
+
+# Brute-force oracles
+
+def _coin_change(coins, amount):
+    level, seen, steps = {0}, {0}, 0
+    while level:
+        if amount in level:
+            return steps
+        level = {t + c for t in level for c in coins if t + c <= amount} - seen
+        seen |= level
+        steps += 1
+    return -1
+
+
+def _frequency_sort(s):
+    return ''.join(sorted(s, key=lambda c: (-s.count(c), c)))
+
+
+def _group_anagrams(strs):
+    groups = {}
+    for s in strs:
+        groups.setdefault(''.join(sorted(s)), []).append(s)
+    return [sorted(g) for g in groups.values()]
+
+
+def _max_subarray(nums):
+    return max(sum(nums[i:j]) for i in range(len(nums)) for j in range(i + 1, len(nums) + 1))
+
+
+def _merge_intervals(intervals):
+    groups = [[list(iv)] for iv in intervals]
+    merged = True
+    while merged:
+        merged = False
+        for g, h in itertools.combinations(range(len(groups)), 2):
+            a = [min(s for s, _ in groups[g]), max(e for _, e in groups[g])]
+            b = [min(s for s, _ in groups[h]), max(e for _, e in groups[h])]
+            if a[0] <= b[1] and b[0] <= a[1]:
+                groups[g] += groups.pop(h)
+                merged = True
+                break
+    return sorted([min(s for s, _ in g), max(e for _, e in g)] for g in groups)
+
+
+def _number_of_islands(grid):
+    land = {(r, c) for r, row in enumerate(grid) for c, cell in enumerate(row) if cell == '1'}
+    islands = 0
+    while land:
+        islands += 1
+        todo = [land.pop()]
+        while todo:
+            r, c = todo.pop()
+            for cell in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if cell in land:
+                    land.remove(cell)
+                    todo.append(cell)
+    return islands
+
+
+def _product_except_self(nums):
+    return [math.prod(nums[:i] + nums[i + 1:]) for i in range(len(nums))]
+
+
+def _three_sum(nums):
+    found = {tuple(t) for t in itertools.combinations(sorted(nums), 3) if sum(t) == 0}
+    return [list(t) for t in sorted(found)]
+
+
+def _top_k_frequent(nums, k):
+    return [v for v, _ in sorted(Counter(nums).items(), key=lambda vc: (-vc[1], vc[0]))[:k]]
+
+
+def _two_sum_sorted_ok(nums, target, result):
+    pairs = [(i, j) for i, j in itertools.combinations(range(len(nums)), 2)
+             if nums[i] + nums[j] == target]
+    if not pairs:
+        return result == [-1, -1]
+    i, j = result
+    return 0 <= i < j < len(nums) and nums[i] + nums[j] == target
+
+
+def _ints(rng, lo, hi, n):
+    return [rng.randint(lo, hi) for _ in range(n)]
+
+
+def _floats(rng, n):
+    return [rng.choice(FLOATS) for _ in range(n)]
+
+
+SEEDS = range(200)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_coin_change_oracle(kernel, seed):
+    rng = random.Random(seed)
+    coins = sorted(set(_ints(rng, 1, 12, rng.randint(1, 4))))
+    amount = rng.randint(0, 40)
+    assert kernel('coin_change')(coins, amount) == _coin_change(coins, amount)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_frequency_sort_oracle(kernel, seed):
+    rng = random.Random(seed)
+    s = ''.join(rng.choice('aabbcZ9 \u00e9\u4e2d' if seed % 2 else 'abcab') for _ in range(rng.randint(0, 20)))
+    assert kernel('frequency_sort')(s) == _frequency_sort(s)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_group_anagrams_oracle(kernel, seed):
+    rng = random.Random(seed)
+    alphabet = 'abc' if seed % 2 else 'abAB1\u00e9'
+    strs = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 4)))
+            for _ in range(rng.randint(0, 10))]
+    assert kernel('group_anagrams')(strs) == _group_anagrams(strs)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_max_subarray_oracle(kernel, seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 12)
+    nums = _floats(rng, n) if seed % 3 == 0 else _ints(rng, -20, 20, n)
+    if seed % 7 == 0:
+        nums = [x * 2**60 for x in _ints(rng, -8, 8, n)]  # sums leave int64
+    assert kernel('max_subarray')(nums) == _max_subarray(nums)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_merge_intervals_oracle(kernel, seed):
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(rng.randint(0, 10)):
+        start = rng.choice(FLOATS) * 8 if seed % 3 == 0 else rng.randint(-20, 20)
+        intervals.append([start, start + (rng.choice(FLOATS[5:]) if seed % 3 == 0 else rng.randint(0, 6))])
+    if seed % 2:
+        intervals.sort()
+    assert kernel('merge_intervals')(copy.deepcopy(intervals)) == _merge_intervals(intervals)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_number_of_islands_oracle(kernel, seed):
+    rng = random.Random(seed)
+    rows, cols = rng.randint(1, 8), rng.randint(1, 8)
+    density = rng.random()
+    grid = [['1' if rng.random() < density else '0' for _ in range(cols)] for _ in range(rows)]
+    if seed % 2:
+        grid = [''.join(row) for row in grid]  # rows given as strings
+    assert kernel('number_of_islands')(grid) == _number_of_islands(grid)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_product_except_self_oracle(kernel, seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 8)
+    bound = rng.choice([3, 100, 10**4, 10**9])  # int32, int64 and bigint products
+    nums = _floats(rng, n) if seed % 3 == 0 else _ints(rng, -bound, bound, n)
+    assert kernel('product_except_self')(nums) == _product_except_self(nums)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_three_sum_oracle(kernel, seed):
+    rng = random.Random(seed)
+    n = rng.choice([rng.randint(0, 10), rng.randint(17, 40)])  # below and above SMALL_N
+    nums = _floats(rng, n) if seed % 3 == 0 else _ints(rng, -8, 8, n)
+    if seed % 5 == 0:
+        nums = [x * 10**6 for x in nums]  # outside the counting range
+    result = kernel('three_sum')(nums)
+    assert result == _three_sum(nums)
+    assert all(type(x) is type(nums[0]) for t in result for x in t)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_top_k_frequent_oracle(kernel, seed):
+    rng = random.Random(seed)
+    n = rng.randint(1, 20)
+    nums = _floats(rng, n) if seed % 3 == 0 else _ints(rng, -5, 5, n)
+    k = rng.randint(1, len(set(nums)))
+    assert kernel('top_k_frequent')(nums, k) == _top_k_frequent(nums, k)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_two_sum_sorted_oracle(kernel, seed):
+    rng = random.Random(seed)
+    n = rng.randint(2, 10)
+    if seed % 3 == 0:
+        nums, target = sorted(_floats(rng, n)), rng.choice(FLOATS) * 2
+    else:
+        nums, target = sorted(_ints(rng, -20, 20, n)), rng.randint(-30, 30)
+    assert _two_sum_sorted_ok(nums, target, kernel('two_sum_sorted')(nums, target))
+
+
+def test_coin_change_float_input_is_not_truncated():
+    from problems._coin_change_fast import coin_change
+    with pytest.raises(TypeError):
+        coin_change([1.5], 3)
+    with pytest.raises(TypeError):
+        coin_change([1], 3.0)
+
+
+def test_product_except_self_floats_are_not_truncated():
+    assert product_except_self([1.5, 2.0]) == [2.0, 1.5]
+    assert product_except_self([0.5, 4, 2]) == [8, 1.0, 2.0]
+
+
+def test_product_except_self_strings_are_not_coerced():
+    with pytest.raises(TypeError):
+        product_except_self(['1', '2'])
+
+
+@pytest.mark.parametrize('nums', [
+    [0.5, 3.0, 2.0],          # would hit the int32 kernel if coerced
+    [3.5e6, 2.0e6, 1.5e3],    # would hit the int64 kernel if coerced
+    [1e30, 3.0],              # past both bounds
+])
+def test_product_except_self_float_widths_stay_on_python(nums):
+    assert product_except_self(nums) == _product_python(nums)
+
+
+@pytest.mark.parametrize('nums', [
+    [1, 2, 3, 4],             # int32 kernel
+    [0, -7, 3, 2],
+    [10**6, -10**7, 3, 5],    # int64 kernel
+    [2**40, 2**40, 3],        # Python ints
+])
+def test_product_except_self_integer_widths(nums):
+    result = product_except_self(nums)
+    assert result == _product_python(nums)
+    assert all(type(x) is int for x in result)
+
+
+def test_merge_intervals_float_endpoints_are_not_truncated():
+    assert merge_intervals([[1.5, 2.2], [2.7, 3.0]]) == [[1.5, 2.2], [2.7, 3.0]]
+    assert merge_intervals([[2.5, 4.0], [1.0, 2.5]]) == [[1.0, 4.0]]
+
+
+def test_merge_intervals_record_view_gets_int64():
+    np = pytest.importorskip('numpy')
+    # int32 endpoints must be widened before the 16-byte record view
+    intervals = [[np.int32(s), np.int32(e)] for s, e in [(8, 10), (1, 3), (2, 6)]]
+    assert merge_intervals(intervals) == [[1, 6], [8, 10]]
+
+
+def test_max_subarray_floats_are_not_truncated():
+    assert max_subarray([0.5, 0.5]) == 1.0
+    assert max_subarray([-0.5, 2.25, -1.0, 1.0]) == 2.25
+
+
+def test_max_subarray_large_sums_do_not_wrap():
+    assert max_subarray([2**62, 2**62, 2**62]) == 3 * 2**62
+
+
+def test_two_sum_sorted_floats_are_not_truncated():
+    assert two_sum_sorted([0.5, 1.5], 2) == [0, 1]
+    assert two_sum_sorted([1, 2, 3], 4.5) == [-1, -1]
+    assert two_sum_sorted([1, 2, 3], 5.0) == [1, 2]
+
+
+def test_three_sum_small_results_are_not_shared():
+    first = three_sum([-1, 0, 1, 2, -1, -4])
+    first[0].append(99)
+    first.clear()
+    assert three_sum([-1, 0, 1, 2, -1, -4]) == [[-1, -1, 2], [-1, 0, 1]]
@@ -0,0 +1,48 @@
+"""Globals the pooled Node worker (runners/runner.js) gives submissions."""
+
+import shutil
+
+import pytest
+
+import app as glider
+
+pytestmark = pytest.mark.skipif(shutil.which('node') is None, reason='node not installed')
+
+
+def _run(code, tests=((2, 3),)):
+    return glider.execute_javascript(code, list(tests), 'summation')
+
+
+def test_commonjs_script_globals_are_available():
+    code = """
+const util = require('util');
+const { strictEqual } = require('node:assert');
+function summation(a, b) {
+    process.stdout.write(util.format('%d+%d', a, b) + '\\n');
+    strictEqual(typeof Buffer.from, 'function');
+    strictEqual(new TextEncoder().encode('hé').length, 3);
+    strictEqual(typeof process.argv, 'object');
+    clearTimeout(setTimeout(() => {}, 10));
+    setInterval(() => {}, 1000);  // left pending: cancelled after the run
+    setImmediate(() => {});
+    return a + b;
+}
+module.exports = { summation };
+exports.other = 1;
+"""
+    [(result, stdout, stderr)] = _run(code)
+    assert result == 5
+    assert '2+3\n' in stdout
+    assert stderr == ''
+
+
+def test_other_modules_are_rejected():
+    with pytest.raises(RuntimeError, match=r"require\('fs'\) is not available"):
+        _run("const fs = require('fs');\nfunction summation(a, b) { return a + b; }\n")
+
+
+def test_process_exit_fails_only_that_test():
+    code = "function summation(a, b) { if (a < 0) process.exit(1); return a + b; }\n"
+    first, second = _run(code, [(-1, 1), (2, 3)])
+    assert isinstance(first, Exception) and 'process.exit(1)' in str(first)
+    assert second[0] == 5
@@ -0,0 +1,55 @@
+"""The orjson fast path must send the same JSON values as jsonify."""
+
+import json
+
+import pytest
+
+import app as glider
+
+PAYLOADS = [
+    {'passed': 1, 'failed': 0, 'total': 1, 'results': [{'actual': '[0, 1]', 'error': None}]},
+    {'trace': [{'event': 'line', 'line': 3, 'locals': {'b': '2', 'a': "'x'"}}], 'truncated': False},
+    {'stdout': 'café ✓ \U0001f600\n', 'stderr': 'tab\there "quoted" \\ \x00\x1f\x7f'},
+    {'z': [], 'a': {}, 'm': [True, None, -(2**63), 2**64 - 1]},
+    {'big': 2**70},  # beyond orjson's range: falls back to jsonify
+]
+
+
+def _jsonify_bytes(obj):
+    with glider.app.app_context():
+        return glider.jsonify(obj).get_data()
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_json_response_parses_like_jsonify(payload):
+    with glider.app.app_context():
+        body = glider._json_response(payload).get_data()
+    expected = _jsonify_bytes(payload)
+    assert json.loads(body) == json.loads(expected)
+    if expected.isascii() and b'\\u' not in expected:
+        assert body == expected  # ASCII-only payloads are byte-identical
+
+
+def test_static_bodies_match_jsonify():
+    body, _ = glider._PROBLEMS_JSON
+    assert body == _jsonify_bytes([{
+        'name': p['name'], 'title': p['title'], 'description': p['description']
+    } for p in glider.PROBLEMS.values()])
+
+
+def test_submit_response_is_valid_json():
+    client = glider.app.test_client()
+    code = "def summation(a, b):\n    print('résumé')\n    return a + b\n"
+    response = client.post('/api/submit', json={'problem': 'summation', 'code': code})
+    assert response.mimetype == 'application/json'
+    data = json.loads(response.get_data())
+    assert data['passed'] == data['total'] == 3
+    assert data['results'][0]['stdout'] == 'résumé\n'
+
+
+def test_orjson_path_is_used_when_installed():
+    if glider.orjson is None:
+        pytest.skip('orjson not installed')
+    with glider.app.app_context():
+        body = glider._json_response({'stdout': 'café'}).get_data()
+    assert body == '{"stdout":"café"}\n'.encode('utf-8')  # jsonify would send caf\\u00e9
@@ -0,0 +1,76 @@
+"""Return values coming back from the pooled Python worker (runners/py_runner.py)."""
+
+import math
+
+import app as glider
+
+
+def _run(code, tests=((2, 3),)):
+    return glider.execute_python(code, list(tests), 'summation')
+
+
+def _result(code):
+    [(result, stdout, stderr)] = _run(code)
+    return result
+
+
+def test_tuple_stays_a_tuple():
+    result = _result("def summation(a, b):\n    return (a, b)\n")
+    assert result == (2, 3) and type(result) is tuple
+    assert str(result) == '(2, 3)'
+
+
+def test_literal_containers_keep_their_types():
+    result = _result("def summation(a, b):\n    return {'s': {a, b}, 'b': b'x', 'n': None, 't': [(a,)]}\n")
+    assert result == {'s': {2, 3}, 'b': b'x', 'n': None, 't': [(2,)]}
+
+
+def test_inf_and_nan_come_back_as_floats():
+    assert _result("def summation(a, b):\n    return float('inf')\n") == math.inf
+    assert math.isnan(_result("def summation(a, b):\n    return float('nan')\n"))
+
+
+def test_other_objects_come_back_as_their_str():
+    code = """
+class Pair:
+    def __str__(self):
+        return 'Pair'
+def summation(a, b):
+    return Pair()
+"""
+    assert _result(code) == 'Pair'
+    assert _result("def summation(a, b):\n    return frozenset([a])\n") == 'frozenset({2})'
+
+
+def test_stdout_is_kept_alongside_the_result():
+    [(result, stdout, stderr)] = _run("def summation(a, b):\n    print('hi')\n    return a + b\n")
+    assert (result, stdout, stderr) == (5, 'hi\n', '')
+
+
+def _error(code):
+    [outcome] = _run(code)
+    assert isinstance(outcome, Exception)
+    return f'{type(outcome).__name__}: {outcome}'
+
+
+def test_key_error_reads_as_raised():
+    assert _error("def summation(a, b):\n    raise KeyError('x')\n") == "KeyError: 'x'"
+    assert _error("def summation(a, b):\n    return {}[a]\n") == 'KeyError: 2'
+
+
+def test_exceptions_with_several_args():
+    assert _error("def summation(a, b):\n    raise ValueError('bad', a, b)\n") == "ValueError: ('bad', 2, 3)"
+    assert _error("def summation(a, b):\n    raise OSError(2, 'gone')\n") == 'FileNotFoundError: [Errno 2] gone'
+
+
+def test_other_exceptions_keep_their_name_and_message():
+    code = "class Oops(Exception):\n    pass\ndef summation(a, b):\n    raise Oops(object())\n"
+    assert _error(code).startswith('Oops: <object object at ')
+    assert _error("def summation(a, b):\n    raise KeyError(object())\n").startswith('KeyError: <object object at ')
+
+
+def test_submit_shows_key_error_like_in_process():
+    client = glider.app.test_client()
+    code = "def summation(a, b):\n    raise KeyError('x')\n"
+    reply = client.post('/api/submit', json={'code': code, 'problem': 'summation', 'language': 'python'})
+    assert {r['error'] for r in reply.get_json()['results']} == {"KeyError: 'x'"}
@@ -0,0 +1,39 @@
+"""Unknown language values fall back as they always did, without touching the caches."""
+
+import app as glider
+
+
+def test_problem_page_for_unknown_language_uses_fallback_stub():
+    client = glider.app.test_client()
+    before = glider._problem_json.cache_info().currsize
+    reply = client.get('/api/problem/summation?language=rust')
+    assert reply.status_code == 200
+    page = reply.get_json()
+    assert page['language'] == 'rust'
+    with open('problems/summation.py') as f:
+        assert page['stub'] == f.read()
+    assert glider._problem_json.cache_info().currsize == before
+
+
+def test_unknown_language_gets_generic_tutor_prompt():
+    assert 'friendly programming algorithms tutor' in glider._system_message.__wrapped__('rust')
+    context = glider._problem_context.__wrapped__(None, 'rust', False, False, False)
+    assert context == ('The user is working in rust.',)
+
+
+def test_ask_with_unknown_language_is_answered(monkeypatch):
+    sent = []
+
+    def fake_post(path, payload, api_key, timeout):
+        sent.append(payload)
+        return b'{"choices": [{"message": {"content": "ok"}}]}'
+
+    monkeypatch.setattr(glider, 'reload_env_if_valid', lambda: ('sk-' + 'a' * 30, 'test'))
+    monkeypatch.setattr(glider, '_openai_post', fake_post)
+    before = glider._system_message.cache_info().currsize
+    reply = glider.app.test_client().post('/api/ask', json={'prompt': 'hi', 'language': 'rust'})
+    assert reply.status_code == 200 and reply.get_json() == {'answer': 'ok'}
+    system, user = sent[0]['messages']
+    assert 'friendly programming algorithms tutor' in system['content']
+    assert 'The user is working in rust.' in user['content']
+    assert glider._system_message.cache_info().currsize == before